@@ -0,0 +1,236 @@
+import json
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from timeit import Timer
+
+from blackjack import Blackjack
+from card import Card
+from deck import Deck, Shoe
+from hand import DealerHand, PlayerHand
+from log import OFF
+from shuffle import Shuffle
+
+# A benchmark is a regression when it takes this many times its baseline.
+TOLERANCE = 1.25
+DECK_SIZES = [52, 104, 208, 416]
+ROUND_COUNTS = [10, 20, 40, 80]
+
+
+def measure(function, repeat=3):
+    """
+    Returns the best time of `repeat` runs of calling `function`, in
+    seconds per call. Each run makes enough calls to take at least 0.2
+    seconds.
+
+    >>> measure(lambda: None, repeat=1) > 0
+    True
+    """
+    timer = Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def _hand(num_cards, num_aces=0):
+    hand = PlayerHand()
+    aces = [Card('A', suit) for suit in ['clubs', 'diamonds', 'hearts', 'spades']]
+    others = [Card(rank, 'spades') for rank in [2, 3, 4, 5, 6, 7, 8, 9, 10]]
+    hand.add_card(*(aces[:num_aces] + others[:num_cards - num_aces]))
+    return hand
+
+
+def _game(num_rounds=5):
+    blackjack = Blackjack(10 ** 6, log_level=OFF, summaries=False)
+    blackjack.play_round(num_rounds, 17)
+    return blackjack
+
+
+def _dealt_hand():
+    hand = DealerHand()
+    hand.add_code(51, 0, 20)
+    hand.reveal_hand()
+    return hand
+
+
+def memory(function, number=1000):
+    """
+    Returns the bytes of memory still held per object when `number`
+    objects made by `function` are kept alive, as traced by tracemalloc.
+
+    >>> memory(lambda: None, 10)
+    0.0
+    """
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [function() for i in range(number)]
+        held = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is not part of their size.
+    return max(held - sys.getsizeof(objects), 0) / number
+
+
+def memory_benchmarks():
+    """
+    Returns every memory benchmark as a dictionary of name to function
+    making one object to measure.
+    """
+    return {
+        'card_bytes': lambda: Card('A', 'spades'),
+        'dealer_hand_bytes': _dealt_hand,
+        'game_bytes': _game,
+    }
+
+
+def _add_codes(codes, keep_order=False):
+    hand = PlayerHand(keep_order)
+    for code in codes:
+        hand.add_code(code)
+
+
+def _play_round(summaries, num_rounds=13, deck=Deck, sort_hands=True):
+    blackjack = Blackjack(10 ** 6, deck(), log_level=OFF, summaries=summaries, sort_hands=sort_hands)
+    blackjack.play_round(num_rounds, 17)
+    blackjack.close()
+
+
+def benchmarks():
+    """
+    Returns every benchmark as a dictionary of name to function.
+    """
+    card_1, card_2 = Card(10, 'hearts'), Card('A', 'spades')
+    hand = _hand(8)
+    blackjack = Blackjack(0, summaries=False)
+    cases = {
+        'card_lt': lambda: card_1 < card_2,
+        'sort_hand': hand.sort_hand,
+        'deck_init': Deck,
+        'mongean': lambda: Shuffle.mongean(list(range(52))),
+        'modified_overhand': lambda: Shuffle.modified_overhand(list(range(52)), 4),
+        'play_round_summaries_on': lambda: _play_round(True),
+        'play_round_summaries_off': lambda: _play_round(False),
+        'play_round_deal_order': lambda: _play_round(False, sort_hands=False),
+        'add_code_8': lambda: _add_codes([51, 3, 40, 7, 22, 0, 33, 12]),
+        'add_code_8_deal_order': lambda: _add_codes([51, 3, 40, 7, 22, 0, 33, 12], True),
+    }
+    for num_aces in range(5):
+        aces_hand = _hand(max(num_aces, 2), num_aces)
+        cases['calculate_score_' + str(num_aces) + '_aces'] = \
+            lambda aces_hand=aces_hand: blackjack.calculate_score(aces_hand)
+    # Scaling curves, as the deck and the number of rounds grow.
+    for size in DECK_SIZES:
+        cases['mongean_' + str(size)] = lambda size=size: Shuffle.mongean(list(range(size)))
+        cases['deck_shuffle_' + str(size)] = lambda size=size: Shoe(size // 52).shuffle(modified_overhand=4, mongean=4)
+    for num_rounds in ROUND_COUNTS:
+        cases['play_round_' + str(num_rounds) + '_rounds'] = \
+            lambda num_rounds=num_rounds: _play_round(False, num_rounds, lambda: Shoe(8))
+    return cases
+
+
+def run(names=None, repeat=3):
+    """
+    Runs the benchmarks named in `names` (all of them by default) in a
+    temporary directory, so summary files go nowhere.
+
+    Returns:
+        A dictionary of name to seconds per call.
+    """
+    cases = benchmarks()
+    results = {}
+    cwd = os.getcwd()
+    with TemporaryDirectory() as directory:
+        os.chdir(directory)
+        os.mkdir('game_summaries')
+        try:
+            for name in cases if names is None else names:
+                results[name] = measure(cases[name], repeat)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def run_memory(names=None, number=1000):
+    """
+    Runs the memory benchmarks named in `names` (all of them by default).
+
+    Returns:
+        A dictionary of name to bytes per object.
+    """
+    cases = memory_benchmarks()
+    results = {}
+    cwd = os.getcwd()
+    with TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for name in cases if names is None else names:
+                results[name] = memory(cases[name], number)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Returns the (name, ratio to baseline) of every benchmark that takes
+    more than `tolerance` times its baseline.
+
+    >>> compare({'deck_init': 2.0, 'mongean': 1.0}, {'deck_init': 1.0, 'mongean': 1.0})
+    [('deck_init', 2.0)]
+    """
+    return [(name, results[name] / baseline[name]) for name in results
+            if name in baseline and results[name] > tolerance * baseline[name]]
+
+
+def save(results, path, kind='time'):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'kind': kind, 'results': results}, f,
+                  indent=2, sort_keys=True)
+
+
+def load(path, kind='time'):
+    """
+    Returns the results saved in `path`, which must be of the same
+    `kind`, 'time' or 'memory', as they are compared with.
+    """
+    with open(path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved.get('kind', 'time') == kind, path + ' holds ' + saved.get('kind', 'time') + ' results'
+    return saved['results']
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Time the hot paths of the game.')
+    parser.add_argument('names', nargs='*', help='benchmarks to run, all by default')
+    parser.add_argument('--output', help='where to write the results, bench.json or bench_memory.json by default')
+    parser.add_argument('--baseline', help='results to compare with, bench_baseline.json or '
+                                           'bench_memory_baseline.json by default')
+    parser.add_argument('--save-baseline', action='store_true', help='also write the results as the baseline')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--memory', action='store_true', help='measure bytes per object instead of time')
+    args = parser.parse_args()
+    kind = 'memory' if args.memory else 'time'
+    if args.output is None:
+        args.output = 'bench_memory.json' if args.memory else 'bench.json'
+    if args.baseline is None:
+        args.baseline = 'bench_memory_baseline.json' if args.memory else 'bench_baseline.json'
+
+    if args.memory:
+        results = run_memory(args.names or None)
+    else:
+        results = run(args.names or None, args.repeat)
+    baseline = load(args.baseline, kind) if os.path.exists(args.baseline) else {}
+    for name, value in results.items():
+        line = f'{name:32s} {value:12.1f} bytes' if args.memory else f'{name:32s} {value * 1e6:12.3f} us'
+        if name in baseline:
+            line += f'   x{value / baseline[name]:.2f} of baseline'
+        print(line)
+    save(results, args.output, kind)
+    if args.save_baseline:
+        save(results, args.baseline, kind)
+    regressions = compare(results, baseline)
+    for name, ratio in regressions:
+        print(f'REGRESSION {name}: {ratio:.2f} times the baseline')
+    sys.exit(1 if regressions else 0)
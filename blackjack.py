@@ -1,6 +1,12 @@
-from deck import Deck
+from deck import Deck, Shoe
 from hand import DealerHand, PlayerHand
-from card import Card
+from card import ACE, CARD_VALUES, Card
+from log import FULL, make_log
+from solver import SOLVER, rank_counts
+from strategy import SolverStrategy
+from summary import SummaryPaths, SummaryWriter
+from gameids import GameIds
+from time import perf_counter
 
 # don't change these imports
 from numpy.random import randint, seed
@@ -47,6 +53,19 @@ class Blackjack:
     >>> blackjack.calculate_score(hand_3)
     6
 
+    >>> hand_4 = PlayerHand()
+    >>> hand_4.add_card(card_1, card_3, Card(9, "clubs"))
+    >>> blackjack.calculate_score(hand_4) # (Ace, Ace, 9)
+    21
+    >>> hand_5 = PlayerHand()
+    >>> hand_5.add_card(card_2, Card(5, "clubs"), card_1, Card(5, "hearts"))
+    >>> blackjack.calculate_score(hand_5) # (Jack, 5, Ace, 5)
+    21
+    >>> hand_6 = PlayerHand()
+    >>> hand_6.add_card(*[Card("A", "hearts") for i in range(5)])
+    >>> blackjack.calculate_score(hand_6) # (5 Aces from a multi-deck shoe)
+    15
+
     #######################################
     ### Doctests for determine_winner() ####
     #######################################
@@ -165,24 +184,105 @@ class Blackjack:
     Player lost with a score of 24. Dealer won with a score of 17.
     Wallet amount $0 is less than bet amount $5.
 
-    >>> blackjack_4 = Blackjack(500)
+    >>> blackjack_4 = Blackjack(500, summaries=False)
     >>> blackjack_4.play_round(13, 21) # At least 52 cards will be dealt
     >>> blackjack_4.reset_log()
     >>> blackjack_4.play_round(1, 17)
     >>> print(blackjack_4.get_log())
     Not enough cards for a game.
+    >>> blackjack_4.reset_log()
+
+    >>> blackjack_5 = Blackjack(500, Shoe(2), summaries=False)
+    >>> blackjack_5.play_round(40, 17) # A shoe is reshuffled instead
+    >>> blackjack_5.deck.reshuffles > 0
+    True
+    >>> 'Not enough cards' in blackjack_5.get_log()
+    False
+    >>> blackjack_5.reset_log()
+
+    >>> from numpy.random import default_rng
+    >>> blackjack_6 = Blackjack(50, rng=default_rng(7), summaries=False)
+    >>> blackjack_7 = Blackjack(50, rng=default_rng(7), summaries=False)
+    >>> blackjack_6.play_round(1, 17)
+    >>> blackjack_4.play_round(1, 17) # Draws from the global stream
+    >>> blackjack_7.play_round(1, 17)
+    >>> blackjack_6.get_log() == blackjack_7.get_log()
+    True
+    >>> blackjack_7.reset_log()
+    >>> blackjack_6.reset_log()
+
+    >>> from solver import SOLVER
+    >>> blackjack_8 = Blackjack(50, rng=default_rng(7), summaries=False)
+    >>> blackjack_8.play_round(2, SOLVER) # Hits by the solver
+    >>> blackjack_8.get_log().count('Round ')
+    2
+    >>> blackjack_8.reset_log()
+
+    >>> from strategy import TableStrategy
+    >>> blackjack_9 = Blackjack(50, rng=default_rng(7), summaries=False)
+    >>> blackjack_9.play_round(2, TableStrategy()) # Any strategy decides
+    >>> blackjack_9.get_log().count('Round ')
+    2
+    >>> blackjack_9.reset_log()
+
+    >>> from timing import PhaseTimer
+    >>> timer = PhaseTimer()
+    >>> blackjack_10 = Blackjack(50, timer=timer, summaries=False)
+    >>> blackjack_10.play_round(3, 17)
+    >>> timer.calls['shuffle'], timer.calls['dealer']
+    (3, 3)
+    >>> blackjack_10.reset_log()
+    >>> timer.reset()
+    >>> blackjack_11 = Blackjack(500, Shoe(2), timer=timer, summaries=False)
+    >>> blackjack_11.play_round(40, 17)
+    >>> timer.calls['reshuffle'] == blackjack_11.deck.reshuffles > 0
+    True
+    >>> blackjack_11.reset_log()
     """
     # Class Attribute(s)
 
-    num_games = 1
+    # Numbers of the games, for exported and recorded rounds, unique to
+    # each process. A pool's workers can replace it with their own
+    # gameids.worker_ids() for numbers that only depend on the worker.
+    game_ids = GameIds()
+    # Game summary files are numbered apart from the games.
+    summary_paths = SummaryPaths('game_summaries/game_summary{}.txt')
 
-    def __init__(self, wallet):
+    def __init__(self, wallet, deck=None, rng=None, log_level=FULL, exporter=None, recorder=None,
+                 summaries=True, timer=None, close_summaries=False, sort_hands=True,
+                 accumulate_hands=False):
         # Initialize instance attributes
         # auto-increment as needed
-        self.deck = Deck()
+        # `deck` can be a Shoe to play rounds past a single deck.
+        # `rng` is the game's own numpy Generator or RandomState for the
+        # shuffle counts; by default the global numpy stream is used.
+        # `log_level` OFF keeps no log, for simulations.
+        # `exporter` is a RoundExporter that gets a row for every round.
+        # `recorder` is a ReplayWriter that gets the shuffle counts and
+        # dealt cards of every round, so the game can be replayed.
+        # `summaries` False writes no game summary file. The file stays
+        # open from one play_round call to the next until close();
+        # `close_summaries` True closes it at the end of every call.
+        # `timer` is a PhaseTimer that times the phases of every round.
+        # `sort_hands` False keeps the hands in deal order, which skips
+        # all sorting when nothing displays them.
+        # `accumulate_hands` True keeps every card dealt in a play_round
+        # call in the hands, round after round, as the game used to.
+        self.deck = Deck() if deck is None else deck
+        self.rng = rng
+        self.summary = None
+        self.summaries = summaries
+        self.close_summaries = close_summaries
         self.wallet = wallet
-        Blackjack.num_games+= 1
-        self.log = ''
+        self.game_id = Blackjack.game_ids.allocate()
+        self.log = make_log(log_level)
+        self.exporter = exporter
+        self.recorder = recorder
+        self.timer = timer
+        self.sort_hands = sort_hands
+        self.accumulate_hands = accumulate_hands
+        # Rounds are numbered on from one play_round call to the next.
+        self.rounds_played = 0
 
     
     def play_round(self, num_rounds, stand_threshold):
@@ -191,55 +291,111 @@ class Blackjack:
 
         Parameters:
             num_rounds (int): Number of rounds to play.
-            stand_threshold (int): Score threshold for when the player
+            stand_threshold: Score threshold for when the player
             will stand (ie player stands if they have a score >= 
-            this threshold)
+            this threshold), solver.SOLVER to hit by the solver, or a
+            strategy (see strategy.py) that decides every hit.
         """
         assert isinstance(num_rounds, int)
-        assert isinstance(stand_threshold, int)
-        player_hand = PlayerHand()
-        dealer_hand = DealerHand()
+        assert isinstance(stand_threshold, int) or stand_threshold == SOLVER or callable(stand_threshold)
+        if stand_threshold == SOLVER:
+            stand_threshold = SolverStrategy()
+        player_hand = PlayerHand(keep_order=not self.sort_hands)
+        dealer_hand = DealerHand(keep_order=not self.sort_hands)
         bet_amount = 5
         min_cards = 4
+        timer = self.timer
+        played_before = self.rounds_played
         for i in range(num_rounds):
-            if len(self.deck.cards) < min_cards:
-                self.log+= 'Not enough cards for a game.'
+            reshuffle_counts = None
+            # A shoe is only reshuffled for a round that is played, so the
+            # counts drawn for it are recorded with that round.
+            if self.deck.needs_reshuffle() and self.wallet >= bet_amount:
+                if timer is not None:
+                    start = perf_counter()
+                reshuffle_counts = self.deck.random_reshuffle(self.rng)
+                if timer is not None:
+                    timer.record('reshuffle', start)
+            if self.deck.remaining() < min_cards:
+                self.log.not_enough_cards()
                 bet_amount = 5
                 break
             elif self.wallet < bet_amount:
-                self.log+= 'Wallet amount $' + str(self.wallet) \
-                    + ' is less than bet amount $' + str(bet_amount) + '.'
+                self.log.low_wallet(self.wallet, bet_amount)
                 bet_amount = 5
                 break
             else:
-                self.log+= 'Round ' + str(i+1) + ' of Blackjack!\nwallet: ' + str(self.wallet) + '\nbet: ' + str(bet_amount) + '\n'
-                times_for_mongeen = randint(0, 5)
-                times_for_modified = randint(0, 5)
-                self.deck.shuffle(modified_overhand=times_for_modified, mongean=times_for_mongeen)
-                self.deck.deal_hand(player_hand)
-                self.deck.deal_hand(dealer_hand)
-                self.deck.deal_hand(player_hand)
-                self.deck.deal_hand(dealer_hand)
+                self.rounds_played += 1
+                round_number = self.rounds_played
+                self.log.round_start(round_number, self.wallet, bet_amount)
+                if timer is not None:
+                    start = perf_counter()
+                counts = self.deck.random_shuffle(self.rng)
+                if timer is not None:
+                    start = timer.record('shuffle', start)
+                dealt = self.deck.deal(min_cards)
+                if not self.accumulate_hands:
+                    player_hand.reset()
+                    dealer_hand.reset()
+                player_hand.add_code(dealt[0], dealt[2])
+                dealer_hand.add_code(dealt[1], dealt[3])
                 
-                self.log+= 'Player Cards: ' + player_hand.__repr__() + '\n' \
-                    + 'Dealer Cards: ' + dealer_hand.__repr__() + '\n'
-                self.hit_or_stand(player_hand, stand_threshold)
+                self.log.deal(player_hand, dealer_hand)
+                if timer is not None:
+                    start = timer.record('deal', start)
+                self.hit_or_stand(player_hand, stand_threshold, dealer_hand)
+                if timer is not None:
+                    start = timer.record('player', start)
                 dealer_hand.reveal_hand()
-                self.log+= 'Dealer Cards Revealed: ' + dealer_hand.__repr__() + '\n'
+                self.log.reveal(dealer_hand)
                 self.hit_or_stand(dealer_hand, 17)
-                winner = self.determine_winner(self.calculate_score(player_hand), self.calculate_score(dealer_hand))
+                if timer is not None:
+                    start = timer.record('dealer', start)
+                player_score = self.calculate_score(player_hand)
+                dealer_score = self.calculate_score(dealer_hand)
+                winner = self.determine_winner(player_score, dealer_score)
+                if timer is not None:
+                    start = timer.record('determine_winner', start)
+                bet, wallet_before = bet_amount, self.wallet
                 if winner == 1:
+                    self.log.wallet_change(self.wallet, self.wallet + bet_amount)
                     self.wallet+= bet_amount
                     bet_amount+=5
-                    self.add_to_file(player_hand, dealer_hand, 'Player', i+1)
+                    self.add_to_file(player_hand, dealer_hand, 'Player', round_number)
                 elif winner == -1:
+                    self.log.wallet_change(self.wallet, self.wallet - bet_amount)
                     self.wallet-= bet_amount
-                    bet_amount-=5
-                    self.add_to_file(player_hand, dealer_hand, 'Dealer', i+1)
+                    bet_amount = max(bet_amount - 5, 5)
+                    self.add_to_file(player_hand, dealer_hand, 'Dealer', round_number)
                 else:
                     self.wallet = self.wallet
                     bet_amount = bet_amount
-                    self.add_to_file(player_hand, dealer_hand, 'Tied', i+1)
+                    self.add_to_file(player_hand, dealer_hand, 'Tied', round_number)
+                if timer is not None:
+                    start = timer.record('add_to_file', start)
+                if self.exporter is not None:
+                    self.exporter.write_round(self.game_id, round_number, bet, wallet_before, self.wallet,
+                                              player_hand.codes, dealer_hand.codes,
+                                              player_score, dealer_score, winner)
+                if self.recorder is not None:
+                    self.recorder.write_round(self.game_id, round_number, wallet_before, stand_threshold,
+                                              counts, self.deck.dealt_codes(), reshuffle_counts,
+                                              num_rounds if i == 0 else None)
+                if timer is not None:
+                    timer.record('export', start)
+        if self.recorder is not None and self.rounds_played == played_before:
+            # A call that played no round still ends the log of the game.
+            self.recorder.write_call(self.game_id, self.rounds_played, self.wallet, stand_threshold, num_rounds)
+        if self.summary is not None:
+            # The rounds of the call are all in the file when it returns.
+            if timer is not None:
+                start = perf_counter()
+            if self.close_summaries:
+                self.summary.close()
+            else:
+                self.summary.flush()
+            if timer is not None:
+                timer.record('write_summary', start)
                 
                 
     
@@ -250,120 +406,19 @@ class Blackjack:
         Sums up the ranks of each card in a hand. Jacks, Queens, and Kings
         have a value of 10 and Aces have a value of 1 or 11. The value of each
         Ace card is dependent on which value would bring the score closer
-        (but not over) 21. 
+        (but not over) 21. If every total is over 21, the lowest one is
+        the closest.
 
-        Should be solved using list comprehension and map/filter. No explicit
-        for loops.
+        The hand keeps a running total as cards are added, so this is a
+        constant time lookup for any number of Aces.
 
         Parameters:
             hand: The hand to calculate the score of.
         Returns:
             The best score as an integer value.
         """
-        total_num_a = 4
-        assert len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) <= total_num_a
-        assert all([isinstance(i, Card) for i in hand.cards])
         assert isinstance(hand, PlayerHand) or isinstance(hand, DealerHand)
-        two = 2
-        three = 3
-        four = 4
-        first_a_value = 1
-        second_a_value = 11
-        jqk_value = 10
-        threshold = 21
-
-        if len(hand.cards) == 0:
-            return 0
-        elif len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) == 0:
-            jqk_values = sum([jqk_value for rank in [card.rank for card in hand.cards] if rank == 'J' or rank == 'Q' or rank == 'K'])
-            non_jqka_value = sum([int(rank) for rank in [card.rank for card in hand.cards] if isinstance(rank, int)])
-
-            result1 = jqk_values + non_jqka_value
-
-            return result1
-
-        elif len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) == 1:
-            jqk_values = sum([jqk_value for rank in [card.rank for card in hand.cards] if rank == 'J' or rank == 'Q' or rank == 'K'])
-            non_jqka_value = sum([int(rank) for rank in [card.rank for card in hand.cards] if isinstance(rank, int)])
-
-
-            result1 = jqk_values + non_jqka_value + first_a_value
-            result2 = jqk_values + non_jqka_value + second_a_value
-            results = [result1, result2]
-
-            if all(i > threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            elif all(i <= threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            else:
-                return [i for i in results if i < threshold][0]
-        
-        elif len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) == two:
-            jqk_values = sum([jqk_value for rank in [card.rank for card in hand.cards] if rank == 'J' or rank == 'Q' or rank == 'K'])
-            non_jqka_value = sum([int(rank) for rank in [card.rank for card in hand.cards] if isinstance(rank, int)])
-
-            result1 = jqk_values + non_jqka_value + first_a_value + first_a_value
-            result2 = jqk_values + non_jqka_value + second_a_value + second_a_value
-            result3 = jqk_values + non_jqka_value + first_a_value + second_a_value
-            results = [result1, result2, result3]
-
-            if all(i > threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            elif all(i <= threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            else:
-                lt_threshold = [i for i in results if i < threshold]
-                abs_results = [abs(i-threshold) for i in lt_threshold]
-                return lt_threshold[abs_results.index(min(abs_results))]
-                
-        elif len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) == three:
-            jqk_values = sum([jqk_value for rank in [card.rank for card in hand.cards] if rank == 'J' or rank == 'Q' or rank == 'K'])
-            non_jqka_value = sum([int(rank) for rank in [card.rank for card in hand.cards] if isinstance(rank, int)])
-
-            result1 = jqk_values + non_jqka_value + first_a_value + first_a_value + first_a_value
-            result2 = jqk_values + non_jqka_value + first_a_value + first_a_value + second_a_value
-            result3 = jqk_values + non_jqka_value + first_a_value + second_a_value + second_a_value
-            result4 = jqk_values + non_jqka_value + second_a_value + second_a_value + second_a_value
-            results = [result1, result2, result3, result4]
-
-            if all(i > threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            elif all(i <= threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            else:
-                lt_threshold = [i for i in results if i < threshold]
-                abs_results = [abs(i-threshold) for i in lt_threshold]
-                return lt_threshold[abs_results.index(min(abs_results))]
-
-        elif len([rank for rank in [card.rank for card in hand.cards] if rank == 'A']) == four:
-            jqk_values = sum([jqk_value for rank in [card.rank for card in hand.cards] if rank == 'J' or rank == 'Q' or rank == 'K'])
-            non_jqka_value = sum([int(rank) for rank in [card.rank for card in hand.cards] if isinstance(rank, int)])
-
-            result1 = jqk_values + non_jqka_value + first_a_value + first_a_value + first_a_value + first_a_value
-            result2 = jqk_values + non_jqka_value + first_a_value + first_a_value + first_a_value + second_a_value
-            result3 = jqk_values + non_jqka_value + first_a_value + first_a_value + second_a_value + second_a_value
-            result4 = jqk_values + non_jqka_value + first_a_value + second_a_value + second_a_value + second_a_value
-            result5 = jqk_values + non_jqka_value + second_a_value + second_a_value + second_a_value + second_a_value
-            results = [result1, result2, result3, result4, result5]
-
-            if all(i > threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            elif all(i <= threshold for i in results) == True:
-                abs_results = [abs(i - threshold) for i in results]
-                return results[abs_results.index(min(abs_results))]
-            else:
-                lt_threshold = [i for i in results if i < threshold]
-                abs_results = [abs(i-threshold) for i in lt_threshold]
-                return lt_threshold[abs_results.index(min(abs_results))]
-            
-        
+        return hand.score()
 
 
     def determine_winner(self, player_score, dealer_score):
@@ -379,46 +434,28 @@ class Blackjack:
         
         if player_score < threshold and dealer_score < threshold:
             if abs(threshold - player_score) < abs(threshold - dealer_score):
-                self.log+= 'Player won with a score of ' + str(player_score) \
-                    + '. Dealer lost with a score of ' + str(dealer_score) + '.\n'
-                return 1
+                winner = 1
             elif abs(threshold - player_score) > abs(threshold - dealer_score):
-                self.log+= 'Player lost with a score of ' + str(player_score) \
-                    + '. Dealer won with a score of ' + str(dealer_score) + '.\n'
-                return -1
+                winner = -1
             else:
-                self.log+= 'Player and Dealer tie.\n' 
-                return 0
-
-
-        if player_score < threshold and dealer_score > threshold:
-            self.log+= 'Player won with a score of ' + str(player_score) \
-                    + '. Dealer lost with a score of ' + str(dealer_score) + '.\n'
-            return 1
+                winner = 0
+        elif player_score < threshold and dealer_score > threshold:
+            winner = 1
         elif player_score > threshold and dealer_score < threshold:
-            self.log+= 'Player lost with a score of ' + str(player_score) \
-                    + '. Dealer won with a score of ' + str(dealer_score) + '.\n'
-            return -1
-
+            winner = -1
         elif player_score > threshold and dealer_score > threshold:
-            self.log+= 'Player and Dealer tie.\n'
-            return 0
-    
+            winner = 0
         elif player_score == threshold and dealer_score == threshold:
-            self.log+= 'Player and Dealer tie.\n' #+ str(player_score) + str(dealer_score)
-            return 0
-
+            winner = 0
         elif player_score == threshold and dealer_score != threshold:
-            self.log+= 'Player won with a score of ' + str(player_score) \
-                    + '. Dealer lost with a score of ' + str(dealer_score) + '.\n'
-            return 1
+            winner = 1
+        else:
+            winner = -1
 
-        elif player_score != threshold and dealer_score == threshold:
-            self.log+= 'Player lost with a score of ' + str(player_score) \
-                    + '. Dealer won with a score of ' + str(dealer_score) + '.\n'
-            return -1
+        self.log.result(winner, player_score, dealer_score)
+        return winner
 
-    def hit_or_stand(self, hand, stand_threshold):
+    def hit_or_stand(self, hand, stand_threshold, dealer_hand=None):
         """
         Deals cards to hand until the hand score has reached or surpassed
         the `stand_threshold`. Updates the log everytime a card is pulled.
@@ -427,28 +464,49 @@ class Blackjack:
             hand: The hand the deal the cards to depending on its score.
             stand_threshold: Score threshold for when the player
             will stand (ie player stands if they have a score >= 
-            this threshold).
+            this threshold), or a strategy (see strategy.py) that
+            decides every hit.
+            dealer_hand: The dealer's hand, needed for a strategy.
         """
 
-        for i in self.deck.cards:
-            if self.calculate_score(hand) >= stand_threshold:
-                break
-            elif self.calculate_score(hand) < stand_threshold:
-                deal_card = self.deck.cards[0]
-                self.deck.deal_hand(hand)
-                if type(hand) == PlayerHand:
-                    self.log+= 'Player pulled a ' + str(deal_card.__repr__()) + '\n'
-                elif type(hand) == DealerHand:
-                    self.log+= 'Dealer pulled a ' + str(deal_card.__repr__()) + '\n'
-            elif len(self.deck.cards) == 0:
+        # Stops once the pulls catch up with the cards left, as the
+        # original loop over the deck list did while dealing from it.
+        pulls = 0
+        while pulls < self.deck.remaining():
+            if not isinstance(stand_threshold, int):
+                if not self.strategy_hit(stand_threshold, hand, dealer_hand):
+                    break
+            elif self.calculate_score(hand) >= stand_threshold:
                 break
+            pulls += 1
+            deal_code = self.deck.peek_code()
+            self.deck.deal_hand(hand)
+            if type(hand) == PlayerHand:
+                self.log.hit('Player', deal_code)
+            elif type(hand) == DealerHand:
+                self.log.hit('Dealer', deal_code)
         
+    def strategy_hit(self, strategy, hand, dealer_hand):
+        """
+        Returns whether `strategy` hits `hand` against the dealer's
+        visible cards. The dealer's hole card, its last card, is left out
+        of them and counted with the cards left in the deck, since the
+        player cannot see it. The composition of those cards is only
+        worked out for strategies that use it.
+        """
+        hole = dealer_hand.codes[-1]
+        dealer_hard = dealer_hand.hard_total - CARD_VALUES[hole]
+        dealer_aces = dealer_hand.num_aces - (CARD_VALUES[hole] == ACE)
+        counts = None
+        if getattr(strategy, 'uses_counts', True):
+            counts = rank_counts(self.deck.undealt_codes() + [hole])
+        return strategy(hand.hard_total, hand.num_aces, dealer_hard, dealer_aces, counts)
+
     def get_log(self):
-        return self.log
+        return self.log.render()
     
     def reset_log(self):
-        self.log = ''
-        Blackjack.num_games-=1
+        self.log.clear()
            
     def add_to_file(self, player_hand, dealer_hand, result, round):
         """
@@ -456,8 +514,23 @@ class Blackjack:
         corresponding .txt file. This file should be named game_summaryX.txt 
         where X is the game number and it should be in `game_summaries` 
         directory.
+
+        Rounds are appended to the file in batches; play_round writes the
+        last of them before returning. The file is
+        claimed from Blackjack.summary_paths when the first round is
+        written, so X is the number of the file, not of the game, and no
+        two games write to the same file.
         """
-        
-        # Remember to use encoding = "utf-8" 
-        with open('game_summaries/game_summary' + str(Blackjack.num_games) + '.txt', mode= 'w+', encoding= 'utf-8') as f:
-            f.write('ROUND' + str(round) + '\n' + 'Player Hand:\n' + player_hand.__str__() + 'Dealer Hand:\n' + dealer_hand.__str__() + 'Winner of ROUND 1: ' + result + '\n')
\ No newline at end of file
+        if not self.summaries:
+            return
+        if self.summary is None:
+            self.summary = SummaryWriter(Blackjack.summary_paths.claim())
+        self.summary.write_round(player_hand, dealer_hand, result, round)
+
+    def close(self):
+        """
+        Writes the last rounds and closes the game summary file, once the
+        game is over.
+        """
+        if self.summary is not None:
+            self.summary.close()
@@ -1,3 +1,35 @@
+import sys
+
+# Cards are encoded as integers 0-51, rank index * 4 + suit index, so
+# the codes follow both the order of a new Deck and the sorting order.
+RANKS = [2, 3, 4, 5, 6, 7, 8, 9, 10, 'J', 'Q', 'K', 'A']
+SUITS = ['clubs', 'diamonds', 'hearts', 'spades']
+NUM_CARDS = len(RANKS) * len(SUITS)
+
+CARD_RANKS = [RANKS[code // len(SUITS)] for code in range(NUM_CARDS)]
+CARD_SUITS = [SUITS[code % len(SUITS)] for code in range(NUM_CARDS)]
+CARD_CODES = {(CARD_RANKS[code], CARD_SUITS[code]): code for code in range(NUM_CARDS)}
+
+# Blackjack value of every card, with Aces counted as 1.
+ACE = 1
+RANK_VALUES = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, ACE]
+CARD_VALUES = [RANK_VALUES[code // len(SUITS)] for code in range(NUM_CARDS)]
+
+# ASCII art and representation of every card and of a hidden card, built
+# once so printing a card is a table lookup.
+SUIT_SYMBOLS = {'clubs': '♣', 'diamonds': '♦', 'hearts': '♥', 'spades': '♠'}
+
+
+def _art(rank, symbol):
+    return sys.intern('____\n|' + str(rank) + '  |\n| ' + symbol + ' |\n|__' + str(rank) + '|')
+
+
+CARD_ART = [_art(CARD_RANKS[code], SUIT_SYMBOLS[CARD_SUITS[code]]) for code in range(NUM_CARDS)]
+HIDDEN_ART = _art('?', '?')
+CARD_REPRS = [sys.intern(f'({CARD_RANKS[code]}, {CARD_SUITS[code]})') for code in range(NUM_CARDS)]
+HIDDEN_REPR = '(?, ?)'
+
+
 class Card:
     """
     Card class.
@@ -57,54 +89,45 @@ class Card:
 
     # Class Attribute(s)
 
+    # No per-card __dict__: simulations make many cards.
+    __slots__ = ('code', 'visible')
+
     def __init__(self, rank, suit, visible=True):
         """
         Creates a card instance and asserts that the rank and suit are valid.
         """
-        ranks = [i for i in range(2, 11)] + ['A', 'J', 'Q', 'K']
-        suits = ['hearts', 'spades', 'clubs', 'diamonds']
+        assert (rank, suit) in CARD_CODES
+        assert isinstance(visible, bool)
 
-        self.rank = rank
-        self.suit = suit
+        self.code = CARD_CODES[(rank, suit)]
         self.visible = visible
 
-        assert self.rank in ranks
-        assert self.suit in suits
-        assert isinstance(visible, bool)
-        
+    def from_code(code, visible=True):
+        """
+        Creates a card instance from its integer code.
+
+        >>> Card.from_code(0)
+        (2, clubs)
+        >>> Card.from_code(51)
+        (A, spades)
+        >>> Card.from_code(Card(10, "hearts").code)
+        (10, hearts)
+        """
+        card = Card.__new__(Card)
+        card.code = code
+        card.visible = visible
+        return card
+
+    @property
+    def rank(self):
+        return CARD_RANKS[self.code]
+
+    @property
+    def suit(self):
+        return CARD_SUITS[self.code]
 
     def __lt__(self, other_card):
-        def rank_order(rank):
-            if rank == 'J':
-                return 11
-            elif rank == 'Q':
-                return 12
-            elif rank == 'K':
-                return 13
-            elif rank == 'A':
-                return 14
-            else:
-                return rank
-
-        def suit_order(suit):
-            if suit == 'clubs':
-                return 0
-            elif suit == 'diamonds':
-                return 1
-            elif suit == 'hearts':
-                return 2
-            elif suit == 'spades':
-                return 3
-        
-        if rank_order(self.rank) > rank_order(other_card.rank):
-            return False
-        elif rank_order(self.rank) < rank_order(other_card.rank):
-            return True
-        elif rank_order(self.rank) == rank_order(other_card.rank):
-            if suit_order(self.suit) > suit_order(other_card.suit):
-                return False
-            else:
-                return True
+        return self.code < other_card.code
 
 
     def __str__(self):
@@ -122,44 +145,10 @@ class Card:
         | ? |
         |__?|             
         """
-        def invisible_card():
-            s = "____" + "\n"
-            s = s + "|?  |" + "\n"
-            s = s + "| ? |" + "\n"
-            s = s + "|__?|"
-            return s
-        
-        def visible_card(rank, suit):
-            if suit == 'hearts':
-                s = "____" + "\n"
-                s = s + "|" + str(rank) + "  |" + "\n"
-                s = s + "| ♥ |" + "\n"
-                s = s + "|__" + str(rank) + "|"
-                return s
-            elif suit == 'spades':
-                s = "____" + "\n"
-                s = s + "|" + str(rank) + "  |" + "\n"
-                s = s + "| ♠ |" + "\n"
-                s = s + "|__" + str(rank) + "|"
-                return s
-            elif suit == 'clubs':
-                s = "____" + "\n"
-                s = s + "|" + str(rank) + "  |" + "\n"
-                s = s + "| ♣ |" + "\n"
-                s = s + "|__" + str(rank) + "|"
-                return s
-            elif suit == 'diamonds':
-                s = "____" + "\n"
-                s = s + "|" + str(rank) + "  |" + "\n"
-                s = s + "| ♦ |" + "\n"
-                s = s + "|__" + str(rank) + "|"
-                return s
-
-
         if self.visible == True:
-            return f'{visible_card(self.rank, self.suit)}'
+            return CARD_ART[self.code]
         else:
-            return f'{invisible_card()}'
+            return HIDDEN_ART
 
     def __repr__(self):
         """
@@ -167,9 +156,9 @@ class Card:
         put in place of the actual rank and suit.           
         """        
         if self.visible == True:
-            return f'({self.rank}, {self.suit})'
+            return CARD_REPRS[self.code]
         else:
-            return '(?, ?)'
+            return HIDDEN_REPR
 
     def get_rank(self):
         return self.rank
@@ -1,4 +1,4 @@
-from card import Card
+from card import Card, NUM_CARDS
 from hand import PlayerHand, DealerHand
 from shuffle import Shuffle
 
@@ -18,6 +18,22 @@ class Deck:
     >>> deck.deal_hand(hand)
     >>> deck.get_cards()[0]
     (Q, clubs)
+
+    >>> deck.remaining()
+    51
+    >>> deck.peek()
+    (Q, clubs)
+    >>> deck.peek_code()
+    40
+    >>> deck.deal(2)
+    [40, 32]
+    >>> deck.remaining()
+    49
+    >>> deck.dealt_codes(), deck.undealt_codes()[:2]
+    ([48, 40, 32], [21, 13])
+    >>> deck.reset()
+    >>> deck.remaining(), deck.get_cards()[:2]
+    (52, [(2, clubs), (2, diamonds)])
     """
 
     # Class Attribute(s)
@@ -25,12 +41,24 @@ class Deck:
     def __init__(self):
         """
         Creates a Deck instance containing cards sorted in ascending order.
+        The deck holds integer card codes; Card objects are only built
+        when the cards are looked at. Cards are dealt by moving the `top`
+        cursor instead of removing them from the list.
         """
-        ranks = [i for i in range(2, 11)] + ['J', 'Q', 'K', 'A']
-        suits = ['clubs', 'diamonds', 'hearts', 'spades']
-        self.cards = [Card(j, i) for j in ranks for i in suits]
+        self.codes = list(range(NUM_CARDS))
+        self.top = 0
 
-        
+    def reset(self):
+        """
+        Gathers every card back in ascending order, reusing the list of
+        codes, so one deck can be played game after game.
+        """
+        self.codes[:] = range(NUM_CARDS)
+        self.top = 0
+
+    @property
+    def cards(self):
+        return [Card.from_code(code) for code in self.undealt_codes()]
 
     def shuffle(self, **shuffle_and_count):
         """Shuffles the deck using a variety of different shuffles.
@@ -41,14 +69,28 @@ class Deck:
             should be called.
         """
         assert all([isinstance(key, str) and isinstance(value, int) for key, value in shuffle_and_count.items()])
+        codes = self.codes[self.top:]
         for key, value in shuffle_and_count.items():
             if key == 'modified_overhand':
-                self.cards = Shuffle.modified_overhand(self.cards, value)
+                permutation = Shuffle.permutation(len(codes), 'modified_overhand', value)
             else:
-                for i in range(value):
-                    self.cards = Shuffle.mongean(self.cards)
+                permutation = Shuffle.permutation(len(codes), 'mongean', value)
+            codes = Shuffle.apply(codes, permutation)
+        self.codes = codes
+        self.top = 0
 
-                    
+    def random_shuffle(self, rng=None):
+        """
+        Shuffles the deck with a random number (0 to 4) of modified
+        overhand and mongean shuffles drawn from `rng` (see
+        Shuffle.random_counts), the mongean count first.
+
+        Returns:
+            The (mongean, modified_overhand) counts that were used.
+        """
+        mongean, modified_overhand = Shuffle.random_counts(rng, 2)
+        self.shuffle(modified_overhand=modified_overhand, mongean=mongean)
+        return mongean, modified_overhand
 
     def deal_hand(self, hand):
         """
@@ -57,10 +99,131 @@ class Deck:
         
         assert isinstance(hand, PlayerHand) or isinstance(hand, DealerHand)
 
-        first_card = self.cards[0]
-        self.cards.pop(0)
-        hand.add_card(first_card)
+        hand.add_code(self.codes[self.top])
+        self.top += 1
+
+    def deal(self, num_cards):
+        """
+        Takes the first `num_cards` cards from the deck and returns
+        their codes.
+        """
+        assert num_cards <= self.remaining()
+
+        codes = self.codes[self.top:self.top + num_cards]
+        self.top += num_cards
+        return codes
+
+    def needs_reshuffle(self):
+        """
+        Returns whether the cards should be gathered and reshuffled before
+        the next round. A single deck is played until it runs out.
+        """
+        return False
+
+    def remaining(self):
+        """
+        Returns the number of cards left in the deck.
+        """
+        return len(self.codes) - self.top
+
+    def peek(self):
+        """
+        Returns the next card to be dealt without dealing it.
+        """
+        return Card.from_code(self.peek_code())
+
+    def peek_code(self):
+        """
+        Returns the code of the next card to be dealt without dealing it.
+        """
+        return self.codes[self.top]
+
+    def dealt_codes(self):
+        """
+        Returns the codes of the cards dealt since the last shuffle, in
+        the order they were dealt.
+        """
+        return self.codes[:self.top]
 
+    def undealt_codes(self):
+        """
+        Returns the codes of the cards left to deal, next card first.
+        """
+        return self.codes[self.top:]
 
     def get_cards(self):
         return self.cards
+
+
+class Shoe(Deck):
+    """
+    Shoe of `num_decks` decks. Once the cards left fall to the cut card,
+    set by `penetration` (the share of the shoe dealt before reshuffling),
+    the shoe needs a reshuffle, which gathers every card back without
+    creating new Card objects.
+
+    >>> shoe = Shoe(2, penetration=0.5)
+    >>> shoe.remaining()
+    104
+    >>> shoe.get_cards()[:4]
+    [(2, clubs), (2, clubs), (2, diamonds), (2, diamonds)]
+    >>> shoe.cut_card
+    52
+    >>> shoe.deal(60)[-2:]
+    [29, 29]
+    >>> shoe.needs_reshuffle()
+    True
+    >>> shoe.reshuffle(modified_overhand=2, mongean=3)
+    >>> shoe.remaining(), shoe.needs_reshuffle(), shoe.reshuffles
+    (104, False, 1)
+    >>> from numpy.random import RandomState
+    >>> shoe.random_reshuffle(RandomState(1))
+    (3, 4)
+    >>> shoe.reshuffles
+    2
+    >>> sorted(shoe.codes) == sorted(Shoe(2).codes)
+    True
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75):
+        """
+        Creates a Shoe instance containing the cards of `num_decks` decks
+        sorted in ascending order.
+        """
+        assert isinstance(num_decks, int) and num_decks > 0
+        assert 0 < penetration <= 1
+
+        Deck.__init__(self)
+        self.codes = [code for code in range(NUM_CARDS) for i in range(num_decks)]
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.cut_card = max(round(len(self.codes) * (1 - penetration)), 4)
+        self.reshuffles = 0
+
+    def needs_reshuffle(self):
+        return self.remaining() <= self.cut_card
+
+    def reset(self):
+        self.codes[:] = [code for code in range(NUM_CARDS) for i in range(self.num_decks)]
+        self.top = 0
+
+    def reshuffle(self, **shuffle_and_count):
+        """
+        Gathers every card of the shoe back in ascending order, then
+        shuffles it with `shuffle_and_count` like Deck.shuffle.
+        """
+        self.reset()
+        self.reshuffles += 1
+        self.shuffle(**shuffle_and_count)
+
+    def random_reshuffle(self, rng=None):
+        """
+        Gathers every card of the shoe back, then shuffles it with random
+        counts drawn from `rng` like Deck.random_shuffle.
+
+        Returns:
+            The (mongean, modified_overhand) counts that were used.
+        """
+        self.reset()
+        self.reshuffles += 1
+        return self.random_shuffle(rng)
@@ -0,0 +1,191 @@
+import csv
+from os.path import splitext
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from numpy import asarray, concatenate, int8, int32, int64, load
+from numpy.lib.format import write_array
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Columns of one exported round, in order, with their numpy types. The
+# card codes of a round are variable length, so `player_cards` and
+# `dealer_cards` hold the codes of every round of a chunk one after
+# another and `player_num_cards` and `dealer_num_cards` split them.
+COLUMNS = [('game', int64), ('round', int64), ('bet', int64),
+           ('wallet_before', int64), ('wallet_after', int64),
+           ('player_num_cards', int32), ('dealer_num_cards', int32),
+           ('player_score', int32), ('dealer_score', int32), ('winner', int8)]
+CARD_COLUMNS = ['player_cards', 'dealer_cards']
+
+
+class RoundExporter:
+    """
+    Writes one row per Blackjack round to a columnar file. Rows are
+    buffered and written `chunk_rows` at a time, so only one chunk is
+    ever held in memory.
+
+    The format follows the file suffix: '.npz' writes each chunk as a set
+    of .npy arrays named '<column>/<chunk>', '.parquet' writes each chunk
+    as a row group when pyarrow is installed and falls back to a '.csv'
+    file next to it otherwise, and '.csv' writes plain rows with the card
+    codes separated by spaces.
+
+    >>> from os.path import join
+    >>> from tempfile import TemporaryDirectory
+    >>> with TemporaryDirectory() as directory:
+    ...     path = join(directory, 'rounds.npz')
+    ...     with RoundExporter(path, chunk_rows=2) as exporter:
+    ...         exporter.write_round(1, 1, 5, 10, 15, [32, 48], [40, 21], 21, 17, 1)
+    ...         exporter.write_round(1, 2, 10, 15, 5, [0, 4, 8], [40, 21], 12, 17, -1)
+    ...         exporter.write_round(1, 3, 5, 5, 5, [1, 5], [2, 6], 4, 4, 0)
+    ...     rounds = read_rounds(path)
+    >>> rounds['wallet_after'].tolist()
+    [15, 5, 5]
+    >>> rounds['player_num_cards'].tolist()
+    [2, 3, 2]
+    >>> rounds['player_cards'].tolist()
+    [32, 48, 0, 4, 8, 1, 5]
+    >>> with TemporaryDirectory() as directory:
+    ...     path = join(directory, 'rounds.csv')
+    ...     with RoundExporter(path) as exporter:
+    ...         exporter.write_round(1, 1, 5, 10, 15, [32, 48], [40, 21], 21, 17, 1)
+    ...     with open(path, encoding='utf-8') as f:
+    ...         print(f.read().strip())
+    game,round,bet,wallet_before,wallet_after,player_num_cards,dealer_num_cards,player_score,dealer_score,winner,player_cards,dealer_cards
+    1,1,5,10,15,2,2,21,17,1,32 48,40 21
+    """
+
+    def __init__(self, path, chunk_rows=65536):
+        assert isinstance(chunk_rows, int) and chunk_rows > 0
+
+        root, suffix = splitext(path)
+        assert suffix in ['.npz', '.parquet', '.csv']
+        if suffix == '.parquet' and pyarrow is None:
+            path, suffix = root + '.csv', '.csv'
+
+        self.path = path
+        self.format = suffix[1:]
+        self.chunk_rows = chunk_rows
+        self.chunks = 0
+        self.file = None
+        self.writer = None
+        self.rows = 0
+        self.columns = {name: [] for name, _ in COLUMNS}
+        self.cards = {name: [] for name in CARD_COLUMNS}
+
+    def write_round(self, game, round, bet, wallet_before, wallet_after,
+                    player_cards, dealer_cards, player_score, dealer_score, winner):
+        """
+        Buffers one round, writing the chunk once `chunk_rows` rounds
+        are pending.
+
+        Parameters:
+            player_cards, dealer_cards: Card codes of the final hands.
+            winner: 1 if the player won, 0 for a tie and -1 otherwise.
+        """
+        row = [game, round, bet, wallet_before, wallet_after,
+               len(player_cards), len(dealer_cards), player_score, dealer_score, winner]
+        for (name, _), value in zip(COLUMNS, row):
+            self.columns[name].append(value)
+        self.cards['player_cards'].extend(player_cards)
+        self.cards['dealer_cards'].extend(dealer_cards)
+        self.rows += 1
+        if self.rows >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the pending rounds as one chunk.
+        """
+        if self.rows == 0:
+            return
+        arrays = {name: asarray(self.columns[name], dtype=dtype) for name, dtype in COLUMNS}
+        for name in CARD_COLUMNS:
+            arrays[name] = asarray(self.cards[name], dtype=int8)
+
+        if self.format == 'npz':
+            self._write_npz(arrays)
+        elif self.format == 'parquet':
+            self._write_parquet(arrays)
+        else:
+            self._write_csv()
+
+        self.chunks += 1
+        self.rows = 0
+        self.columns = {name: [] for name, _ in COLUMNS}
+        self.cards = {name: [] for name in CARD_COLUMNS}
+
+    def _write_npz(self, arrays):
+        if self.file is None:
+            self.file = ZipFile(self.path, mode='w', compression=ZIP_DEFLATED)
+        for name, array in arrays.items():
+            with self.file.open(name + '/' + str(self.chunks).zfill(6) + '.npy', mode='w') as f:
+                write_array(f, array)
+
+    def _write_parquet(self, arrays):
+        columns = {name: arrays[name] for name, _ in COLUMNS}
+        for name, counts in [('player_cards', 'player_num_cards'), ('dealer_cards', 'dealer_num_cards')]:
+            offsets = concatenate([[0], arrays[counts].cumsum()])
+            columns[name] = pyarrow.ListArray.from_arrays(offsets.astype('int32'), arrays[name])
+        table = pyarrow.table(columns)
+        if self.writer is None:
+            self.writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def _write_csv(self):
+        if self.file is None:
+            self.file = open(self.path, mode='w', encoding='utf-8', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(column_names())
+        player_cards = iter(self.cards['player_cards'])
+        dealer_cards = iter(self.cards['dealer_cards'])
+        for i in range(self.rows):
+            row = [self.columns[name][i] for name, _ in COLUMNS]
+            row.append(' '.join([str(next(player_cards)) for _ in range(self.columns['player_num_cards'][i])]))
+            row.append(' '.join([str(next(dealer_cards)) for _ in range(self.columns['dealer_num_cards'][i])]))
+            self.writer.writerow(row)
+
+    def close(self):
+        """
+        Writes the pending rounds and closes the file.
+        """
+        self.flush()
+        if self.format == 'parquet' and self.writer is not None:
+            self.writer.close()
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_chunks(path):
+    """
+    Yields the chunks of an exported .npz file one at a time, each as a
+    dictionary of column arrays.
+    """
+    with load(path) as data:
+        names = sorted(set([key.split('/')[1] for key in data.files]))
+        for chunk in names:
+            yield {name: data[name + '/' + chunk] for name in column_names()}
+
+
+def read_rounds(path):
+    """
+    Returns every column of an exported .npz file as one array each.
+    """
+    chunks = list(iter_chunks(path))
+    return {name: concatenate([chunk[name] for chunk in chunks]) for name in column_names()}
+
+
+def column_names():
+    return [name for name, _ in COLUMNS] + CARD_COLUMNS
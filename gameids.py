@@ -0,0 +1,67 @@
+import os
+from secrets import randbelow
+from threading import Lock
+
+# Bits of a game number left for the count within a process; the bits
+# above them hold the process's own random number.
+COUNT_BITS = 32
+
+
+class GameIds:
+    """
+    Hands out game numbers, `first`, `first + step`, `first + 2 * step`
+    and so on. Numbers only go up, so no two games of a run share one,
+    even once a game is over. Safe to share between threads.
+
+    With `per_process` every process, forked ones included, also puts a
+    random number of its own above the low COUNT_BITS bits, so games of
+    different processes, or of runs appending to the same file, do not
+    share numbers either. The numbers still fit in an int64. Without it
+    the numbers are the plain count, and a pool can give each worker its
+    own numbers with worker_ids(): the worker's index is part of every
+    number it hands out.
+
+    >>> ids = GameIds(per_process=False)
+    >>> ids.allocate(), ids.allocate(), ids.allocate()
+    (2, 3, 4)
+    >>> workers = [worker_ids(worker, 3) for worker in range(3)]
+    >>> [[ids.allocate() for i in range(2)] for ids in workers]
+    [[2, 5], [3, 6], [4, 7]]
+    >>> ids = GameIds()
+    >>> first, second = ids.allocate(), ids.allocate()
+    >>> second - first, first % 2 ** COUNT_BITS, 2 ** COUNT_BITS < first < 2 ** 63
+    (1, 2, True)
+    """
+
+    def __init__(self, first=2, step=1, per_process=True):
+        # Numbering starts at 2 like the class counter it replaces, which
+        # started at 1 and was incremented before each game used it.
+        assert isinstance(first, int) and isinstance(step, int) and step > 0
+
+        self.lock = Lock()
+        self.first = first
+        self.next = first
+        self.step = step
+        self.per_process = per_process
+        self.pid = None
+        self.process = 0
+
+    def allocate(self):
+        with self.lock:
+            if self.per_process and self.pid != os.getpid():
+                # A forked child starts from a copy of its parent's
+                # allocator, so it draws its own number on first use.
+                self.pid = os.getpid()
+                self.process = (randbelow(2 ** 31 - 1) + 1) << COUNT_BITS
+                self.next = self.first
+            game_id = self.next
+            self.next += self.step
+            return self.process + game_id
+
+
+def worker_ids(worker, num_workers, first=2):
+    """
+    Returns the allocator of worker number `worker` of `num_workers`
+    processes, whose numbers never meet those of the other workers.
+    """
+    return GameIds(first + worker, num_workers, per_process=False)
@@ -1,4 +1,25 @@
-from card import Card
+from bisect import insort
+
+from card import ACE, CARD_ART, CARD_REPRS, CARD_VALUES, HIDDEN_ART, HIDDEN_REPR, Card
+
+
+def score(hard_total, num_aces):
+    """
+    Returns the blackjack score of a hand with the given total (Aces
+    counted as 1) and number of Aces. One Ace is counted as 11 when that
+    does not go over 21; two Aces at 11 would always go over.
+
+    >>> score(12, 1)
+    12
+    >>> score(10, 1)
+    20
+    >>> score(25, 2)
+    25
+    """
+    if num_aces > 0 and hard_total + 10 <= 21:
+        return hard_total + 10
+    return hard_total
+
 
 class PlayerHand():
     """
@@ -67,11 +88,42 @@ class PlayerHand():
     |__K|
     >>> d_hand
     (4, hearts) (5, spades) (K, diamonds)
+
+    >>> c_hand = PlayerHand()
+    >>> c_hand.add_code(51, 0)
+    >>> c_hand.codes
+    [0, 51]
+    >>> c_hand
+    (2, clubs) (A, spades)
+
+    >>> o_hand = PlayerHand(keep_order=True)
+    >>> o_hand.add_code(51, 0, 20)
+    >>> o_hand
+    (A, spades) (2, clubs) (7, clubs)
+    >>> o_hand.reset()
+    >>> o_hand.codes, o_hand.score()
+    ([], 0)
     """
+
+    # No per-hand __dict__, and reset() lets one hand be reused.
+    __slots__ = ('keep_order', 'codes', 'hard_total', 'num_aces')
     
-    def __init__(self):
-        self.cards = []
+    def __init__(self, keep_order=False):
+        # `keep_order` keeps the cards in the order they were dealt and
+        # never sorts them, for when nothing displays the hand.
+        self.keep_order = keep_order
+        self.codes = []
+        self.hard_total = 0
+        self.num_aces = 0
         
+    def reset(self):
+        """
+        Empties the hand so it can be dealt again, keeping its list.
+        """
+        self.codes.clear()
+        self.hard_total = 0
+        self.num_aces = 0
+
     def add_card(self, *cards):
         """
         Adds cards to the hand, then sorts
@@ -79,9 +131,38 @@ class PlayerHand():
         """
         assert all([isinstance(i, Card) for i in cards])
 
-        for i in cards:
-            self.cards.append(i)
-        self.sort_hand()
+        self.add_code(*[i.code for i in cards])
+
+    def add_code(self, *codes):
+        """
+        Adds cards given by their integer codes to the hand, each one
+        inserted where it keeps the hand in ascending order. The codes
+        sort like the cards, so no Card is compared.
+        """
+        self.add_totals(codes)
+        if self.keep_order:
+            self.codes.extend(codes)
+        else:
+            for code in codes:
+                insort(self.codes, code)
+
+    def add_totals(self, codes):
+        """
+        Updates the running total and Ace count with the given cards.
+        """
+        for code in codes:
+            self.hard_total += CARD_VALUES[code]
+            self.num_aces += CARD_VALUES[code] == ACE
+
+    def score(self):
+        """
+        Returns the score of the hand from its running total.
+        """
+        return score(self.hard_total, self.num_aces)
+
+    @property
+    def cards(self):
+        return [Card.from_code(code) for code in self.codes]
 
     def get_cards(self):
         return self.cards
@@ -91,67 +172,82 @@ class PlayerHand():
         Returns the string representation of all cards
         in the hand, with each card on a new line.
         """
-        output = ''
-        for i in self.cards:
-            output+= i.__str__() + '\n'
-        return output.strip('\n')
+        shown = self.visible_cards()
+        return '\n'.join([CARD_ART[code] for code in self.codes[:shown]]
+                         + [HIDDEN_ART] * (len(self.codes) - shown))
     
     def __repr__(self):
         """
         Returns the representation of all cards, with 
         each card separated by a space.
         """
-        output = ''
-        for i in self.cards:
-            output+= i.__repr__() + ' '
-        return output.strip(' ')
+        shown = self.visible_cards()
+        return ' '.join([CARD_REPRS[code] for code in self.codes[:shown]]
+                        + [HIDDEN_REPR] * (len(self.codes) - shown))
+
+    def visible_cards(self):
+        """
+        Returns how many cards, from the first, are face up. The rest
+        are hidden.
+        """
+        return len(self.codes)
 
     def sort_hand(self):
         """
         Sorts the cards in ascending order.
         """
-        self.cards.sort() 
+        self.codes.sort()
         
     
 class DealerHand(PlayerHand):
+
+    __slots__ = ('hand_visible', 'revealed')
     
-    def __init__(self):
+    def __init__(self, keep_order=False):
         # This should inherit attributes from
         # the parent PlayerHand class.
-        PlayerHand.__init__(self)
+        PlayerHand.__init__(self, keep_order)
         self.hand_visible = False
+        self.revealed = False
 
-    def add_card(self, *cards):
+    def add_code(self, *codes):
         """
         Adds the cards to hand such that only the first card
         in the hand is visible (when the dealer's hand is not visible).
         If the dealer's hand is visible, then add cards to hand as 
-        usual and sort them in ascending order.
+        usual, in ascending order.
         """
-        assert all([isinstance(i, Card) for i in cards])
-
         if self.hand_visible == False:
-            for i in cards:
-                self.cards.append(i)
-            if len(self.cards) > 1:
-                for i in range(1, len(self.cards)):
-                    self.cards[i].set_visible(False)
-            else:
-                self.cards = self.cards
+            self.add_totals(codes)
+            self.codes.extend(codes)
+            self.revealed = False
         else:
-            for i in cards:
-                self.cards.append(i)
-            self.sort_hand()
-        
-        
+            PlayerHand.add_code(self, *codes)
+
+    def reset(self):
+        PlayerHand.reset(self)
+        self.revealed = False
+
+    @property
+    def cards(self):
+        shown = self.visible_cards()
+        return [Card.from_code(code, i < shown) for i, code in enumerate(self.codes)]
+
+    def visible_cards(self):
+        # Only the first card is face up until the hand is revealed.
+        if self.hand_visible or self.revealed:
+            return len(self.codes)
+        return min(len(self.codes), 1)
     
     def reveal_hand(self):
         """
         Makes all the cards in the hand visible
         and sorts them in ascending order.
+
+        Until then the first card dealt, the face up one, has to stay
+        first, so this is the one full sort of the hand; it sorts the
+        integer codes.
         """
-        for i in self.cards:
-            i.set_visible(True)
-        self.sort_hand()
-    
-    
+        self.revealed = True
+        if not self.keep_order:
+            self.sort_hand()
@@ -0,0 +1,74 @@
+import asyncio
+from argparse import ArgumentParser
+from time import perf_counter
+
+from numpy import percentile
+
+
+async def play_table(host, port, rounds, stand_threshold, seed, latencies):
+    """
+    Opens one table on the server, plays `rounds` rounds one PLAY at a
+    time and appends the latency of every PLAY to `latencies`.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f'NEW 1000 {seed}\n'.encode())
+        await writer.drain()
+        reply = await reader.readline()
+        assert reply.startswith(b'OK'), reply
+        for i in range(rounds):
+            start = perf_counter()
+            writer.write(f'PLAY 1 {stand_threshold}\n'.encode())
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(perf_counter() - start)
+            assert reply.startswith(b'OK'), reply
+        writer.write(b'QUIT\n')
+        await writer.drain()
+        await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(host, port, tables=100, rounds=10, stand_threshold=17, concurrency=50):
+    """
+    Plays `tables` tables of `rounds` rounds against a GameServer, at most
+    `concurrency` of them at once.
+
+    Returns:
+        A dictionary of the tables and rounds played, the tables and
+        rounds per second, and the median and 99th percentile round
+        latency in milliseconds.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def table(seed):
+        async with semaphore:
+            await play_table(host, port, rounds, stand_threshold, seed, latencies)
+
+    start = perf_counter()
+    await asyncio.gather(*[table(seed) for seed in range(tables)])
+    elapsed = perf_counter() - start
+    return {'tables': tables, 'rounds': len(latencies), 'seconds': elapsed,
+            'tables_per_second': tables / elapsed, 'rounds_per_second': len(latencies) / elapsed,
+            'p50_ms': float(percentile(latencies, 50)) * 1e3 if latencies else 0.0,
+            'p99_ms': float(percentile(latencies, 99)) * 1e3 if latencies else 0.0}
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Load a Blackjack server with concurrent tables.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--tables', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--stand-threshold', type=int, default=17)
+    parser.add_argument('--concurrency', type=int, default=100)
+    args = parser.parse_args()
+
+    stats = asyncio.run(run_load(args.host, args.port, args.tables, args.rounds,
+                                 args.stand_threshold, args.concurrency))
+    print(f"{stats['tables']} tables, {stats['rounds']} rounds in {stats['seconds']:.2f} s")
+    print(f"{stats['tables_per_second']:.1f} tables/s, {stats['rounds_per_second']:.1f} rounds/s")
+    print(f"round latency p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
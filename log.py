@@ -0,0 +1,167 @@
+from card import CARD_REPRS, HIDDEN_REPR
+
+# Event kinds of a game log.
+ROUND_START = 0
+DEAL = 1
+HIT = 2
+REVEAL = 3
+RESULT = 4
+WALLET_CHANGE = 5
+NOT_ENOUGH_CARDS = 6
+LOW_WALLET = 7
+
+# Log levels: record every event, or record nothing.
+FULL = 'full'
+OFF = 'off'
+
+
+class GameLog:
+    """
+    Log of a Blackjack game kept as a list of event records, each a tuple
+    whose first item is the event kind. Text is only built by render().
+
+    >>> from hand import PlayerHand, DealerHand
+    >>> player_hand = PlayerHand()
+    >>> dealer_hand = DealerHand()
+    >>> player_hand.add_code(32, 48)
+    >>> dealer_hand.add_code(40, 21)
+    >>> log = GameLog()
+    >>> log.round_start(1, 10, 5)
+    >>> log.deal(player_hand, dealer_hand)
+    >>> log.hit('Player', 0)
+    >>> dealer_hand.reveal_hand()
+    >>> log.reveal(dealer_hand)
+    >>> log.result(1, 21, 17)
+    >>> log.wallet_change(10, 15)
+    >>> log.events[:2]
+    [(0, 1, 10, 5), (1, (32, 48), (40, 21), False)]
+    >>> print(log.render())
+    Round 1 of Blackjack!
+    wallet: 10
+    bet: 5
+    Player Cards: (10, clubs) (A, clubs)
+    Dealer Cards: (Q, clubs) (?, ?)
+    Player pulled a (2, clubs)
+    Dealer Cards Revealed: (7, diamonds) (Q, clubs)
+    Player won with a score of 21. Dealer lost with a score of 17.
+    <BLANKLINE>
+    >>> log.clear()
+    >>> log.render()
+    ''
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def round_start(self, round, wallet, bet):
+        self.events.append((ROUND_START, round, wallet, bet))
+
+    def deal(self, player_hand, dealer_hand):
+        self.events.append((DEAL, tuple(player_hand.codes), tuple(dealer_hand.codes),
+                            dealer_hand.hand_visible or dealer_hand.revealed))
+
+    def hit(self, name, code):
+        self.events.append((HIT, name, code))
+
+    def reveal(self, dealer_hand):
+        self.events.append((REVEAL, tuple(dealer_hand.codes)))
+
+    def result(self, winner, player_score, dealer_score):
+        self.events.append((RESULT, winner, player_score, dealer_score))
+
+    def wallet_change(self, before, after):
+        self.events.append((WALLET_CHANGE, before, after))
+
+    def not_enough_cards(self):
+        self.events.append((NOT_ENOUGH_CARDS,))
+
+    def low_wallet(self, wallet, bet):
+        self.events.append((LOW_WALLET, wallet, bet))
+
+    def clear(self):
+        self.events = []
+
+    def render(self):
+        """
+        Returns the text of the log.
+        """
+        return ''.join([render_event(event) for event in self.events])
+
+
+class NullLog(GameLog):
+    """
+    Log that records nothing, for simulations.
+
+    >>> log = NullLog()
+    >>> log.round_start(1, 10, 5)
+    >>> log.render()
+    ''
+    """
+
+    def round_start(self, round, wallet, bet):
+        pass
+
+    def deal(self, player_hand, dealer_hand):
+        pass
+
+    def hit(self, name, code):
+        pass
+
+    def reveal(self, dealer_hand):
+        pass
+
+    def result(self, winner, player_score, dealer_score):
+        pass
+
+    def wallet_change(self, before, after):
+        pass
+
+    def not_enough_cards(self):
+        pass
+
+    def low_wallet(self, wallet, bet):
+        pass
+
+
+def make_log(level):
+    """
+    Returns an empty log for the given level, FULL or OFF.
+    """
+    assert level in [FULL, OFF]
+    return GameLog() if level == FULL else NullLog()
+
+
+def _cards(codes, visible=True):
+    return ' '.join([CARD_REPRS[code] if visible or i == 0 else HIDDEN_REPR for i, code in enumerate(codes)])
+
+
+def render_event(event):
+    """
+    Returns the log text of one event.
+    """
+    kind = event[0]
+    if kind == ROUND_START:
+        return 'Round ' + str(event[1]) + ' of Blackjack!\nwallet: ' + str(event[2]) \
+            + '\nbet: ' + str(event[3]) + '\n'
+    elif kind == DEAL:
+        return 'Player Cards: ' + _cards(event[1]) + '\n' \
+            + 'Dealer Cards: ' + _cards(event[2], event[3]) + '\n'
+    elif kind == HIT:
+        return event[1] + ' pulled a ' + CARD_REPRS[event[2]] + '\n'
+    elif kind == REVEAL:
+        return 'Dealer Cards Revealed: ' + _cards(event[1]) + '\n'
+    elif kind == RESULT:
+        if event[1] == 1:
+            return 'Player won with a score of ' + str(event[2]) \
+                + '. Dealer lost with a score of ' + str(event[3]) + '.\n'
+        elif event[1] == -1:
+            return 'Player lost with a score of ' + str(event[2]) \
+                + '. Dealer won with a score of ' + str(event[3]) + '.\n'
+        else:
+            return 'Player and Dealer tie.\n'
+    elif kind == NOT_ENOUGH_CARDS:
+        return 'Not enough cards for a game.'
+    elif kind == LOW_WALLET:
+        return 'Wallet amount $' + str(event[1]) + ' is less than bet amount $' + str(event[2]) + '.'
+    else:
+        return ''
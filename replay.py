@@ -0,0 +1,309 @@
+from os.path import exists, getsize
+
+from numpy import asarray, dtype, int8, int32, int64, memmap, searchsorted, zeros
+
+from blackjack import Blackjack
+from deck import Deck
+from solver import SOLVER
+from strategy import SolverStrategy
+
+# Stand thresholds recorded for games played with SOLVER and with any
+# other strategy, which has to be given again to replay the game.
+SOLVER_THRESHOLD = -1
+STRATEGY_THRESHOLD = -2
+
+# One fixed-width record per round: the game and round number, the
+# rounds asked of the play_round call the round started (-1 if it did not
+# start one), the wallet and stand threshold the round was played with,
+# the shuffle counts drawn for it (and for the reshuffle of a shoe before
+# it, -1 without one) and where its cards are. The cards dealt in the
+# round, in dealing order, are kept apart in the cards file (see
+# cards_path) as `num_cards` codes from `offset`, so a round can deal any
+# number of cards. A call that played no round gets a record of its own,
+# with `played` 0 and no counts or cards.
+RECORD = dtype([('game', int64), ('round', int32), ('requested', int32), ('played', int8),
+                ('wallet', int64), ('stand_threshold', int32), ('mongean', int8),
+                ('modified_overhand', int8), ('reshuffle_mongean', int8),
+                ('reshuffle_modified_overhand', int8), ('offset', int64), ('num_cards', int32)])
+
+
+def cards_path(path):
+    """
+    Returns the path of the file holding the cards of the replay file
+    `path`.
+    """
+    return path + '.cards'
+
+
+class ReplayWriter:
+    """
+    Appends round records to a replay file, and their cards to its cards
+    file, `flush_every` rounds at a time.
+    """
+
+    def __init__(self, path, flush_every=4096):
+        assert isinstance(flush_every, int) and flush_every > 0
+
+        self.path = path
+        self.flush_every = flush_every
+        self.pending = zeros(flush_every, dtype=RECORD)
+        self.pending_cards = []
+        self.rows = 0
+        self.file = open(path, mode='ab')
+        self.cards_file = open(cards_path(path), mode='ab')
+        self.offset = self.cards_file.tell()
+
+    def write_round(self, game, round, wallet, stand_threshold, counts, cards, reshuffle_counts=None,
+                    requested=None):
+        """
+        Buffers the record of one round.
+
+        Parameters:
+            counts: The (mongean, modified_overhand) counts of the round.
+            cards: The codes of the cards dealt in the round, in order.
+            reshuffle_counts: The counts of the shoe's reshuffle before
+            the round, if it had one.
+            requested: The number of rounds asked of the play_round call,
+            if the round is the first of the call, where the bet starts
+            again at $5.
+        """
+        record = self._record(game, round, wallet, stand_threshold, requested)
+        record['played'] = 1
+        record['mongean'], record['modified_overhand'] = counts
+        record['reshuffle_mongean'], record['reshuffle_modified_overhand'] = \
+            (-1, -1) if reshuffle_counts is None else reshuffle_counts
+        record['offset'] = self.offset
+        record['num_cards'] = len(cards)
+        self.pending_cards.extend(cards)
+        self.offset += len(cards)
+        self._next_row()
+
+    def write_call(self, game, round, wallet, stand_threshold, requested):
+        """
+        Buffers the record of a play_round call that asked for `requested`
+        rounds and played none, after round `round` of the game.
+        """
+        record = self._record(game, round, wallet, stand_threshold, requested)
+        record['played'] = 0
+        record['mongean'] = record['modified_overhand'] = -1
+        record['reshuffle_mongean'] = record['reshuffle_modified_overhand'] = -1
+        record['offset'] = self.offset
+        record['num_cards'] = 0
+        self._next_row()
+
+    def _record(self, game, round, wallet, stand_threshold, requested):
+        record = self.pending[self.rows]
+        record['game'] = game
+        record['round'] = round
+        record['requested'] = -1 if requested is None else requested
+        record['wallet'] = wallet
+        if isinstance(stand_threshold, int):
+            record['stand_threshold'] = stand_threshold
+        elif stand_threshold == SOLVER or isinstance(stand_threshold, SolverStrategy):
+            record['stand_threshold'] = SOLVER_THRESHOLD
+        else:
+            record['stand_threshold'] = STRATEGY_THRESHOLD
+        return record
+
+    def _next_row(self):
+        self.rows += 1
+        if self.rows == self.flush_every:
+            self.flush()
+
+    def flush(self):
+        asarray(self.pending_cards, dtype=int8).tofile(self.cards_file)
+        self.pending[:self.rows].tofile(self.file)
+        self.cards_file.flush()
+        self.file.flush()
+        self.pending_cards = []
+        self.rows = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.cards_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReplayCounts:
+    """
+    Stands in for a RandomState and hands out recorded shuffle counts in
+    order, so a Blackjack game deals exactly the recorded cards again.
+    """
+
+    def __init__(self, records):
+        self.counts = []
+        for record in records:
+            if record['reshuffle_mongean'] >= 0:
+                self.counts += [int(record['reshuffle_mongean']), int(record['reshuffle_modified_overhand'])]
+            self.counts += [int(record['mongean']), int(record['modified_overhand'])]
+        self.next = 0
+
+    def randint(self, low, high, size):
+        assert self.next + size <= len(self.counts), 'No recorded shuffle counts left'
+        counts = self.counts[self.next:self.next + size]
+        self.next += size
+        return asarray(counts)
+
+
+class ReplayStore:
+    """
+    Read-only view of a replay file, mapped into memory rather than read,
+    so any round can be looked up without parsing the file.
+
+    >>> from os.path import join
+    >>> from tempfile import TemporaryDirectory
+    >>> from numpy.random import RandomState
+    >>> directory = TemporaryDirectory()
+    >>> path = join(directory.name, 'games.replay')
+    >>> with ReplayWriter(path) as recorder:
+    ...     game = Blackjack(20, rng=RandomState(3), recorder=recorder, summaries=False)
+    ...     game.play_round(2, 17)
+    ...     game.play_round(3, 17)
+    >>> store = ReplayStore(path)
+    >>> len(store)
+    5
+    >>> [game_id] = store.games()
+    >>> store.cards(game_id, 1)
+    [50, 46, 42, 38]
+    >>> replayed = store.replay(game_id)
+    >>> replayed.get_log() == game.get_log(), replayed.wallet == game.wallet
+    (True, True)
+    >>> store.close()
+
+    A call that runs out of cards or money, and one that plays no round
+    at all, end their log the same way when replayed:
+
+    >>> path = join(directory.name, 'broke.replay')
+    >>> with ReplayWriter(path) as recorder:
+    ...     out_of_cards = Blackjack(10, rng=RandomState(0), recorder=recorder, summaries=False)
+    ...     out_of_cards.play_round(20, 21)
+    ...     out_of_cards.play_round(2, 17)
+    ...     broke = Blackjack(10, rng=RandomState(2), recorder=recorder, summaries=False)
+    ...     broke.play_round(20, 21)
+    ...     broke.play_round(2, 17)
+    >>> store = ReplayStore(path)
+    >>> for game in [out_of_cards, broke]:
+    ...     replayed = store.replay(game.game_id)
+    ...     print(replayed.get_log() == game.get_log(), replayed.get_log().splitlines()[-1])
+    True Not enough cards for a game.Not enough cards for a game.
+    True Wallet amount $0 is less than bet amount $5.Wallet amount $0 is less than bet amount $5.
+    >>> store.close()
+    >>> directory.cleanup()
+    """
+
+    def __init__(self, path):
+        if exists(path) and getsize(path) > 0:
+            self.records = memmap(path, dtype=RECORD, mode='r')
+        else:
+            self.records = zeros(0, dtype=RECORD)
+        if exists(cards_path(path)) and getsize(cards_path(path)) > 0:
+            self.dealt = memmap(cards_path(path), dtype=int8, mode='r')
+        else:
+            self.dealt = zeros(0, dtype=int8)
+        self.order = None
+        self.sorted_games = None
+
+    def __len__(self):
+        return int(self.records['played'].sum())
+
+    def games(self):
+        """
+        Returns the recorded game numbers in ascending order.
+        """
+        self._index()
+        return sorted(set(self.sorted_games.tolist()))
+
+    def _index(self):
+        # Rounds of a game are contiguous in the file only when games are
+        # played one after another, so lookups go through a stable sort.
+        if self.order is None:
+            self.order = self.records['game'].argsort(kind='stable')
+            self.sorted_games = asarray(self.records['game'])[self.order]
+
+    def _records(self, game):
+        # The rounds of `game` and its calls that played no round.
+        self._index()
+        start = searchsorted(self.sorted_games, game, side='left')
+        stop = searchsorted(self.sorted_games, game, side='right')
+        return self.records[self.order[start:stop]]
+
+    def rounds(self, game):
+        """
+        Returns the records of every round of `game`, in order.
+        """
+        records = self._records(game)
+        return records[records['played'] == 1]
+
+    def round(self, game, round):
+        """
+        Returns the record of one round of a game.
+        """
+        records = self.rounds(game)
+        return records[records['round'] == round][0]
+
+    def cards(self, game, round):
+        """
+        Returns the codes of the cards dealt in one round, in order.
+        """
+        record = self.round(game, round)
+        offset = int(record['offset'])
+        return self.dealt[offset:offset + int(record['num_cards'])].tolist()
+
+    def counts(self, game):
+        """
+        Returns a ReplayCounts of the shuffle counts of `game`, to pass as
+        the `rng` of a Blackjack game.
+        """
+        return ReplayCounts(self.rounds(game))
+
+    def replay(self, game, num_rounds=None, deck=None, strategy=None):
+        """
+        Plays a recorded game again with a fresh Blackjack instance.
+
+        Parameters:
+            num_rounds: Rounds to play, all recorded rounds by default.
+            deck: The kind of deck the game was played with, a new Deck
+            by default.
+            strategy: The strategy the game was played with, needed for
+            games recorded with a strategy other than SOLVER.
+        Returns:
+            The Blackjack instance, with the log of the game.
+        """
+        records = self._records(game)
+        assert len(records) > 0
+        blackjack = Blackjack(int(records[0]['wallet']), Deck() if deck is None else deck,
+                              rng=ReplayCounts(records[records['played'] == 1]), summaries=False)
+        # One play_round call per recorded call, asking for as many rounds
+        # as it did, so the bet starts again at every call and a call that
+        # ran out of cards or money stops the same way.
+        starts = [i for i in range(len(records)) if records[i]['requested'] >= 0]
+        left = num_rounds
+        for start, stop in zip(starts, starts[1:] + [len(records)]):
+            requested = int(records[start]['requested'])
+            played = int(records[start:stop]['played'].sum())
+            if left is not None and played >= left:
+                requested = left
+            stand_threshold = int(records[start]['stand_threshold'])
+            if stand_threshold == SOLVER_THRESHOLD:
+                stand_threshold = SOLVER
+            elif stand_threshold == STRATEGY_THRESHOLD:
+                assert strategy is not None, 'The game was played with a strategy'
+                stand_threshold = strategy
+            blackjack.play_round(requested, stand_threshold)
+            if left is not None:
+                left -= min(played, left)
+                if left == 0:
+                    break
+        return blackjack
+
+    def close(self):
+        self.records = zeros(0, dtype=RECORD)
+        self.dealt = zeros(0, dtype=int8)
+        self.order = None
+        self.sorted_games = None
@@ -0,0 +1,67 @@
+from multiprocessing import Pool
+from numpy import empty, intp
+from numpy.random import SeedSequence, default_rng
+from simulate import SimulationResult, num_draws, simulate_vectorized
+
+
+def game_rng(seed, game):
+    """
+    Returns the random Generator of game number `game` in a run seeded
+    with `seed`. It is the game-th child of SeedSequence(seed), the same
+    as SeedSequence(seed).spawn(game + 1)[game], built without spawning
+    the children before it.
+    """
+    return default_rng(SeedSequence(seed, spawn_key=(game,)))
+
+
+def run_chunk(start, stop, wallet, num_rounds, stand_threshold, seed):
+    """
+    Simulates games `start` to `stop - 1` of a run seeded with `seed`.
+    """
+    counts = empty((stop - start, num_draws(num_rounds)), dtype=intp)
+    for game in range(start, stop):
+        counts[game - start] = game_rng(seed, game).integers(0, 5, size=num_draws(num_rounds))
+    return simulate_vectorized(wallet, num_rounds, stand_threshold, counts)
+
+
+def run_games(num_games, wallet, num_rounds, stand_threshold, seed=0, workers=None, chunk_size=10000):
+    """
+    Simulates `num_games` independent games across a pool of `workers`
+    processes and merges the results in game order.
+
+    Every game draws its shuffle counts from its own Generator,
+    game_rng(seed, game), so a game's outcome depends only on the root
+    seed and the game number, never on the worker that played it.
+
+    Parameters:
+        num_games (int): Number of games to simulate.
+        wallet (int): Starting wallet of every game.
+        num_rounds (int): Number of rounds to play.
+        stand_threshold (int): Score at which the player stands.
+        seed (int): Root seed of the run.
+        workers (int): Number of processes. Defaults to one per core;
+        1 runs the games in this process.
+        chunk_size (int): Number of games handed to a worker at a time.
+    Returns:
+        A SimulationResult.
+
+    >>> single = run_games(3000, 100, 10, 17, seed=42, workers=1, chunk_size=500)
+    >>> pooled = run_games(3000, 100, 10, 17, seed=42, workers=3, chunk_size=500)
+    >>> single.final_wallets.tolist() == pooled.final_wallets.tolist()
+    True
+    >>> (single.rounds, single.wins, single.losses) == (pooled.rounds, pooled.wins, pooled.losses)
+    True
+    >>> run_games(0, 100, 10, 17, workers=1)
+    SimulationResult(games=0, rounds=0, win_rate=0.0000, loss_rate=0.0000, tie_rate=0.0000)
+    """
+    assert isinstance(num_games, int) and num_games >= 0
+    assert isinstance(chunk_size, int) and chunk_size > 0
+
+    chunks = [(start, min(start + chunk_size, num_games), wallet, num_rounds, stand_threshold, seed)
+              for start in range(0, num_games, chunk_size)]
+    if workers == 1:
+        results = [run_chunk(*chunk) for chunk in chunks]
+    else:
+        with Pool(workers) as pool:
+            results = pool.starmap(run_chunk, chunks)
+    return SimulationResult.merge(results)
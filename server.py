@@ -0,0 +1,138 @@
+import asyncio
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy.random import default_rng
+
+from blackjack import Blackjack
+from deck import Shoe
+from log import FULL, OFF
+
+# Line protocol, one command per line and one reply line per command:
+#   NEW <wallet> [seed] [decks]     -> OK <game>     starts a table
+#   PLAY <rounds> <stand_threshold> -> OK <wallet>
+#   LOG                             -> OK <lines>, then the log lines
+#   QUIT                            -> BYE
+# Anything else, or a command that fails, gets ERR <message>.
+
+# Most rounds a single PLAY may ask for.
+MAX_ROUNDS = 10000
+
+
+class GameServer:
+    """
+    Hosts one Blackjack table per connection on a single event loop.
+
+    Every table plays from its own Shoe and random Generator. Each PLAY,
+    writing its summary file included, runs on a thread pool, so neither
+    a long PLAY (up to MAX_ROUNDS rounds) nor a slow disk holds up the
+    other tables on the loop.
+
+    >>> from loadgen import run_load
+    >>> async def demo():
+    ...     server = GameServer(summaries=False)
+    ...     listener = await server.start('127.0.0.1', 0)
+    ...     port = listener.sockets[0].getsockname()[1]
+    ...     async with listener:
+    ...         stats = await run_load('127.0.0.1', port, tables=5, rounds=3)
+    ...     await server.close()
+    ...     return stats['tables'], stats['rounds'], server.tables_played
+    >>> asyncio.run(demo())
+    (5, 15, 5)
+    """
+
+    def __init__(self, summaries=True, log=True, workers=4):
+        self.summaries = summaries
+        self.log_level = FULL if log else OFF
+        self.executor = ThreadPoolExecutor(workers)
+        self.tables_played = 0
+        # Tasks of the connections still open, awaited by close().
+        self.sessions = set()
+
+    async def start(self, host, port):
+        """
+        Starts listening and returns the asyncio Server.
+        """
+        return await asyncio.start_server(self.session, host, port)
+
+    async def session(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        self.sessions.add(task)
+        game = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    words = line.decode().split()
+                    command = words[0].upper() if words else ''
+                    if command == 'NEW':
+                        if game is not None:
+                            await self.finish(game)
+                        numbers = [int(word) for word in words[1:]]
+                        seed = numbers[1] if len(numbers) > 1 else None
+                        num_decks = numbers[2] if len(numbers) > 2 else 6
+                        game = Blackjack(numbers[0], Shoe(num_decks), rng=default_rng(seed),
+                                         log_level=self.log_level, summaries=self.summaries)
+                        self.tables_played += 1
+                        reply = 'OK ' + str(game.game_id)
+                    elif command == 'PLAY':
+                        assert game is not None, 'no table, send NEW first'
+                        num_rounds = int(words[1])
+                        assert 0 <= num_rounds <= MAX_ROUNDS, 'at most ' + str(MAX_ROUNDS) + ' rounds per PLAY'
+                        await loop.run_in_executor(self.executor, game.play_round, num_rounds, int(words[2]))
+                        reply = 'OK ' + str(game.wallet)
+                    elif command == 'LOG':
+                        assert game is not None, 'no table, send NEW first'
+                        lines = game.get_log().splitlines()
+                        reply = '\n'.join(['OK ' + str(len(lines))] + lines)
+                    elif command == 'QUIT':
+                        writer.write(b'BYE\n')
+                        await writer.drain()
+                        break
+                    else:
+                        reply = 'ERR unknown command ' + command
+                except (AssertionError, IndexError, ValueError) as error:
+                    reply = 'ERR ' + (str(error) or type(error).__name__)
+                writer.write(reply.encode() + b'\n')
+                await writer.drain()
+        finally:
+            if game is not None:
+                await self.finish(game)
+            writer.close()
+            self.sessions.discard(task)
+
+    async def finish(self, game):
+        # Closing writes the last rounds of the summary file.
+        await asyncio.get_running_loop().run_in_executor(self.executor, game.close)
+
+    async def close(self):
+        """
+        Waits for the open connections to end and their summary files to
+        be closed, then shuts the thread pool down off the event loop.
+        Close the listener first, so no new connection comes in.
+        """
+        await asyncio.gather(*self.sessions)
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+
+async def serve(host, port, summaries=True, log=True):
+    server = GameServer(summaries, log)
+    listener = await server.start(host, port)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Serve Blackjack tables over a line protocol.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--no-summaries', action='store_true', help='write no game summary files')
+    parser.add_argument('--no-log', action='store_true', help='keep no game logs')
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, not args.no_summaries, not args.no_log))
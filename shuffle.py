@@ -1,3 +1,7 @@
+from numpy import asarray, empty, full, intp, nonzero, take_along_axis, unique
+from numpy.random import randint
+
+
 class Shuffle:
     """
     Different kinds of shuffling techniques.
@@ -16,7 +20,24 @@ class Shuffle:
     51
     >>> mongean_shuffle[26]
     25
-    """    
+
+    >>> deck = [i for i in range(52)]
+    >>> table = Shuffle.permutation(52, 'modified_overhand', 1)
+    >>> Shuffle.apply(deck, table) == mod_oh
+    True
+    >>> Shuffle.apply(mod_oh, Shuffle.permutation(52, 'mongean', 1)) == mongean_shuffle
+    True
+    >>> Shuffle.permutation(52, 'mongean', 12) == deck
+    True
+    """
+
+    # Class Attribute(s)
+
+    # Cached permutations keyed by (deck size, shuffle, count).
+    _permutations = {}
+    # Cached arrays of combined permutations keyed by
+    # (deck size, max modified_overhand count, max mongean count).
+    _tables = {}
         
     def modified_overhand(cards, num):
         """
@@ -89,4 +110,129 @@ class Shuffle:
         even_elem = mongeen_helper(cards[1:])
         even_elem.reverse()
         return even_elem + odd_elem
-    
\ No newline at end of file
+
+    def permutation(size, shuffle, count):
+        """
+        Returns the positions that `count` applications of `shuffle`
+        ('mongean' or 'modified_overhand') move to the top of a deck of
+        `size` cards, so that Shuffle.apply(cards, permutation) gives the
+        same deck as the recursive shuffle. Tables are computed once per
+        (size, shuffle, count).
+        """
+        assert isinstance(size, int)
+        assert isinstance(count, int)
+        assert shuffle in ['mongean', 'modified_overhand']
+
+        key = (size, shuffle, count)
+        if key not in Shuffle._permutations:
+            if shuffle == 'modified_overhand':
+                positions = Shuffle.modified_overhand(list(range(size)), count)
+            else:
+                positions = Shuffle.power(Shuffle.mongean(list(range(size))), count)
+            Shuffle._permutations[key] = positions
+        return Shuffle._permutations[key]
+
+    def power(permutation, count):
+        """
+        Returns `permutation` applied `count` times, found by walking each
+        of its cycles once.
+
+        >>> Shuffle.power([1, 2, 0], 2)
+        [2, 0, 1]
+        """
+        result = [None] * len(permutation)
+        for start in range(len(permutation)):
+            if result[start] is not None:
+                continue
+            cycle = [start]
+            while permutation[cycle[-1]] != start:
+                cycle.append(permutation[cycle[-1]])
+            for i in range(len(cycle)):
+                result[cycle[i]] = cycle[(i + count) % len(cycle)]
+        return result
+
+    def apply(cards, permutation):
+        """
+        Gathers `cards` in the order given by `permutation`.
+        """
+        return list(map(cards.__getitem__, permutation))
+
+    def table(size, max_modified_overhand, max_mongean):
+        """
+        Returns an array where table[o, m] is the permutation of a deck of
+        `size` cards shuffled with modified_overhand=o, then mongean=m.
+        """
+        key = (size, max_modified_overhand, max_mongean)
+        if key not in Shuffle._tables:
+            table = empty((max_modified_overhand + 1, max_mongean + 1, size), dtype=intp)
+            for i in range(max_modified_overhand + 1):
+                for j in range(max_mongean + 1):
+                    table[i, j] = Shuffle.apply(
+                        Shuffle.permutation(size, 'modified_overhand', i),
+                        Shuffle.permutation(size, 'mongean', j))
+            Shuffle._tables[key] = table
+        return Shuffle._tables[key]
+
+    def shuffle_many(decks, modified_overhand, mongean, sizes=None):
+        """
+        Shuffles every row of the 2-D array `decks` like
+        Deck.shuffle(modified_overhand=..., mongean=...) with that row's
+        counts, using one fancy-indexing gather per distinct deck size.
+
+        Parameters:
+            decks: array of shape (games, cards).
+            modified_overhand: modified overhand count of every row.
+            mongean: mongean count of every row.
+            sizes: number of cards in every row. The cards of shorter
+            decks are at the start of the row and the rest is padding
+            that is left in place. Defaults to full rows.
+        Returns:
+            The shuffled decks as a new array.
+
+        >>> decks = [[i for i in range(52)], [i for i in range(52)]]
+        >>> shuffled = Shuffle.shuffle_many(decks, [1, 0], [1, 2])
+        >>> list(shuffled[0]) == Shuffle.mongean(Shuffle.modified_overhand(decks[0][:], 1))
+        True
+        >>> list(shuffled[1]) == Shuffle.mongean(Shuffle.mongean(decks[1][:]))
+        True
+        >>> short = Shuffle.shuffle_many([[0, 1, 2, -1], [0, 1, 2, 3]], [0, 0], [1, 1], sizes=[3, 4])
+        >>> short.tolist()
+        [[1, 0, 2, -1], [3, 1, 0, 2]]
+        """
+        decks = asarray(decks)
+        modified_overhand = asarray(modified_overhand)
+        mongean = asarray(mongean)
+        assert decks.ndim == 2
+        assert modified_overhand.shape == mongean.shape == decks.shape[:1]
+
+        shuffled = decks.copy()
+        if len(decks) == 0:
+            return shuffled
+        if sizes is None:
+            sizes = full(len(decks), decks.shape[1])
+        sizes = asarray(sizes)
+        table_key = (int(modified_overhand.max()), int(mongean.max()))
+        for size in unique(sizes).tolist():
+            rows = nonzero(sizes == size)[0]
+            table = Shuffle.table(size, *table_key)
+            index = table[modified_overhand[rows], mongean[rows]]
+            shuffled[rows, :size] = take_along_axis(decks[rows, :size], index, axis=1)
+        return shuffled
+
+    def random_counts(rng, size):
+        """
+        Draws `size` shuffle counts between 0 and 4 in a single call.
+
+        Parameters:
+            rng: a numpy Generator, a RandomState, or None to use the
+            global numpy random stream.
+            size (int): Number of counts to draw.
+        Returns:
+            The counts as a list of ints.
+        """
+        if rng is None:
+            return randint(0, 5, size=size).tolist()
+        elif hasattr(rng, 'integers'):
+            return rng.integers(0, 5, size=size).tolist()
+        else:
+            return rng.randint(0, 5, size=size).tolist()
@@ -0,0 +1,427 @@
+from numpy import arange, array, asarray, concatenate, empty, full, int8, intp, maximum, minimum, nonzero, ones, \
+    sign, take_along_axis, tile, unique, where, zeros
+from numpy.random import RandomState
+from card import ACE, CARD_VALUES, NUM_CARDS
+from hand import score
+from shuffle import Shuffle
+
+_permutations = {}
+
+
+def shuffle_permutation(size, modified_overhand, mongean):
+    """
+    Returns the positions that Deck.shuffle(modified_overhand=...,
+    mongean=...) moves to the top of a deck of `size` cards, combining
+    the two Shuffle tables into a single gather.
+    """
+    key = (size, modified_overhand, mongean)
+    if key not in _permutations:
+        _permutations[key] = Shuffle.apply(
+            Shuffle.permutation(size, 'modified_overhand', modified_overhand),
+            Shuffle.permutation(size, 'mongean', mongean))
+    return _permutations[key]
+
+
+def round_winner(player_score, dealer_score):
+    """
+    Mirrors Blackjack.determine_winner without logging: 1 if the player
+    won, 0 for a tie and -1 if the dealer won.
+
+    >>> round_winner(20, 19), round_winner(22, 23), round_winner(22, 17)
+    (1, 0, -1)
+    """
+    threshold = 21
+    if player_score > threshold:
+        return 0 if dealer_score > threshold else -1
+    elif dealer_score > threshold:
+        return 1
+    else:
+        return (player_score > dealer_score) - (player_score < dealer_score)
+
+
+class GameOutcome:
+    """
+    Outcome of a single simulated game.
+    """
+
+    def __init__(self, wallet):
+        self.wallet = wallet
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+        self.player_busts = 0
+        self.dealer_busts = 0
+
+    def __repr__(self):
+        return f'GameOutcome(wallet={self.wallet}, rounds={self.rounds}, ' \
+            f'wins={self.wins}, losses={self.losses}, ties={self.ties})'
+
+
+def simulate_game(wallet, num_rounds, stand_threshold, seed=None, rng=None, accumulate_hands=False):
+    """
+    Plays one game exactly like Blackjack(wallet).play_round(num_rounds,
+    stand_threshold) after numpy.random.seed(seed), but on bare card codes
+    and without building a log or writing a game summary.
+
+    Parameters:
+        wallet (int): Starting wallet.
+        num_rounds (int): Number of rounds to play.
+        stand_threshold (int): Score at which the player stands.
+        seed (int): Seed of the game's random stream.
+        rng: Generator or RandomState to draw the shuffle counts from, as
+        in Blackjack(wallet, rng=rng). A seed can only be given with a
+        RandomState, which is reseeded with it.
+        accumulate_hands (bool): Keep the cards of every round in the
+        hands, as Blackjack(wallet, accumulate_hands=True).
+    Returns:
+        A GameOutcome.
+
+    >>> simulate_game(10, 1, 15, seed=20)
+    GameOutcome(wallet=15, rounds=1, wins=1, losses=0, ties=0)
+    >>> simulate_game(100, 10, 17, seed=3, accumulate_hands=True)
+    GameOutcome(wallet=105, rounds=10, wins=1, losses=0, ties=9)
+    >>> from numpy.random import default_rng
+    >>> simulate_game(10, 1, 15, seed=1, rng=default_rng(1))
+    Traceback (most recent call last):
+    ...
+    AssertionError: seed can only be given with a RandomState
+    """
+    assert isinstance(num_rounds, int)
+    assert isinstance(stand_threshold, int)
+    if rng is None:
+        rng = RandomState()
+    assert seed is None or isinstance(rng, RandomState), 'seed can only be given with a RandomState'
+    if seed is not None:
+        rng.seed(seed)
+
+    min_cards = 4
+    counts = Shuffle.random_counts(rng, num_draws(num_rounds)) if num_rounds > 0 else []
+
+    permutations, values = _permutations, CARD_VALUES
+    deck = list(range(NUM_CARDS))
+    player_total = player_aces = dealer_total = dealer_aces = 0
+    rounds = wins = losses = player_busts = dealer_busts = 0
+    bet_amount = 5
+    for i in range(num_rounds):
+        if len(deck) < min_cards or wallet < bet_amount:
+            break
+        permutation = permutations.get((len(deck), counts[2 * i + 1], counts[2 * i]))
+        if permutation is None:
+            permutation = shuffle_permutation(len(deck), counts[2 * i + 1], counts[2 * i])
+        deck = list(map(deck.__getitem__, permutation))
+
+        first, second, third, fourth = values[deck[0]], values[deck[1]], values[deck[2]], values[deck[3]]
+        if not accumulate_hands:
+            player_total = player_aces = dealer_total = dealer_aces = 0
+        player_total += first + third
+        player_aces += (first == ACE) + (third == ACE)
+        dealer_total += second + fourth
+        dealer_aces += (second == ACE) + (fourth == ACE)
+        top = min_cards
+
+        # hit_or_stand iterates over the deck while dealing from its front,
+        # so it stops once the pulls catch up with the cards left.
+        pulls = 0
+        size = len(deck)
+        player_score = score(player_total, player_aces)
+        while player_score < stand_threshold and pulls < size - top:
+            value = values[deck[top]]
+            player_total += value
+            player_aces += value == ACE
+            player_score = score(player_total, player_aces)
+            top += 1
+            pulls += 1
+        pulls = 0
+        dealer_score = score(dealer_total, dealer_aces)
+        while dealer_score < 17 and pulls < size - top:
+            value = values[deck[top]]
+            dealer_total += value
+            dealer_aces += value == ACE
+            dealer_score = score(dealer_total, dealer_aces)
+            top += 1
+            pulls += 1
+        del deck[:top]
+
+        rounds += 1
+        player_busts += player_score > 21
+        dealer_busts += dealer_score > 21
+        winner = round_winner(player_score, dealer_score)
+        if winner == 1:
+            wins += 1
+            wallet += bet_amount
+            bet_amount += 5
+        elif winner == -1:
+            losses += 1
+            wallet -= bet_amount
+            bet_amount = max(bet_amount - 5, 5)
+        elif accumulate_hands and player_score > 21 and dealer_score > 21 and player_score >= stand_threshold:
+            # Both hands are bust for good, so every later round deals four
+            # cards, pulls nothing and ties without touching the wallet.
+            if wallet >= bet_amount:
+                remaining = min(num_rounds - i - 1, len(deck) // min_cards)
+                rounds += remaining
+                player_busts += remaining
+                dealer_busts += remaining
+            break
+
+    outcome = GameOutcome(wallet)
+    outcome.rounds = rounds
+    outcome.wins = wins
+    outcome.losses = losses
+    outcome.ties = rounds - wins - losses
+    outcome.player_busts = player_busts
+    outcome.dealer_busts = dealer_busts
+    return outcome
+
+
+class SimulationResult:
+    """
+    Aggregate statistics of many simulated games.
+    """
+
+    def __init__(self, final_wallets, rounds, wins, losses, ties, player_busts, dealer_busts):
+        """
+        Parameters:
+            final_wallets: final wallet of every game.
+            rounds, wins, losses, ties, player_busts, dealer_busts: totals
+            over all games.
+        """
+        self.final_wallets = asarray(final_wallets)
+        self.num_games = len(self.final_wallets)
+        self.rounds = int(rounds)
+        self.wins = int(wins)
+        self.losses = int(losses)
+        self.ties = int(ties)
+        self.player_busts = int(player_busts)
+        self.dealer_busts = int(dealer_busts)
+
+    def from_outcomes(outcomes):
+        """
+        Aggregates a list of GameOutcome.
+        """
+        return SimulationResult(
+            [outcome.wallet for outcome in outcomes],
+            sum([outcome.rounds for outcome in outcomes]),
+            sum([outcome.wins for outcome in outcomes]),
+            sum([outcome.losses for outcome in outcomes]),
+            sum([outcome.ties for outcome in outcomes]),
+            sum([outcome.player_busts for outcome in outcomes]),
+            sum([outcome.dealer_busts for outcome in outcomes]))
+
+    def merge(results):
+        """
+        Combines the results of consecutive batches of games, keeping the
+        games in order. No batches give a result with no games.
+        """
+        if len(results) == 0:
+            return SimulationResult(empty(0, dtype=intp), 0, 0, 0, 0, 0, 0)
+        return SimulationResult(
+            concatenate([result.final_wallets for result in results]),
+            sum([result.rounds for result in results]),
+            sum([result.wins for result in results]),
+            sum([result.losses for result in results]),
+            sum([result.ties for result in results]),
+            sum([result.player_busts for result in results]),
+            sum([result.dealer_busts for result in results]))
+
+    def _rate(self, count):
+        return count / self.rounds if self.rounds > 0 else 0.0
+
+    def win_rate(self):
+        return self._rate(self.wins)
+
+    def loss_rate(self):
+        return self._rate(self.losses)
+
+    def tie_rate(self):
+        return self._rate(self.ties)
+
+    def player_bust_rate(self):
+        return self._rate(self.player_busts)
+
+    def dealer_bust_rate(self):
+        return self._rate(self.dealer_busts)
+
+    def wallet_distribution(self):
+        """
+        Returns the distinct final wallets and how many games ended with each.
+        """
+        return unique(self.final_wallets, return_counts=True)
+
+    def __repr__(self):
+        return f'SimulationResult(games={self.num_games}, rounds={self.rounds}, ' \
+            f'win_rate={self.win_rate():.4f}, loss_rate={self.loss_rate():.4f}, ' \
+            f'tie_rate={self.tie_rate():.4f})'
+
+
+def simulate(num_games, wallet, num_rounds, stand_threshold, seed=0, accumulate_hands=False):
+    """
+    Simulates `num_games` independent games. Game i is seeded with
+    `seed + i`, so it has the same outcome as play_round after
+    numpy.random.seed(seed + i). See simulate_game for
+    `accumulate_hands`.
+
+    >>> result = simulate(1000, 100, 10, 17)
+    >>> result.num_games, result.rounds
+    (1000, 9006)
+    >>> round(result.win_rate() + result.loss_rate() + result.tie_rate(), 6)
+    1.0
+    >>> values, counts = result.wallet_distribution()
+    >>> int(counts.sum())
+    1000
+    """
+    assert isinstance(num_games, int)
+    rng = RandomState()
+    outcomes = [simulate_game(wallet, num_rounds, stand_threshold, seed + i, rng, accumulate_hands)
+                for i in range(num_games)]
+    return SimulationResult.from_outcomes(outcomes)
+
+
+def draw_counts(num_games, num_rounds, seed=0):
+    """
+    Returns the shuffle counts that play_round draws for games seeded
+    with `seed`, `seed + 1`, ..., as an array of shape (num_games, 2 *
+    rounds) holding the mongean and then the modified overhand count of
+    every round. A single deck lasts at most 13 rounds, so no more are
+    drawn.
+    """
+    counts = empty((num_games, num_draws(num_rounds)), dtype=intp)
+    random_state = RandomState()
+    for i in range(num_games):
+        random_state.seed(seed + i)
+        counts[i] = random_state.randint(0, 5, size=num_draws(num_rounds))
+    return counts
+
+
+def num_draws(num_rounds):
+    """
+    Returns how many shuffle counts a single-deck game of `num_rounds`
+    rounds can draw: two per round, for at most 13 rounds.
+    """
+    return 2 * min(num_rounds, NUM_CARDS // 4)
+
+
+def _scores(hard_totals, num_aces):
+    return where((num_aces > 0) & (hard_totals + 10 <= 21), hard_totals + 10, hard_totals)
+
+
+def simulate_vectorized(wallet, num_rounds, stand_threshold, counts, accumulate_hands=False):
+    """
+    Simulates one game per row of `counts` with NumPy, advancing all games
+    one round at a time. Each game has the same outcome as simulate_game
+    with the same shuffle counts, but decks are shuffled together with
+    Shuffle.shuffle_many and cards are dealt with array operations.
+
+    Parameters:
+        wallet (int): Starting wallet of every game.
+        num_rounds (int): Number of rounds to play.
+        stand_threshold (int): Score at which the player stands.
+        counts: array of shape (games, 2 * rounds) with the mongean and
+        then the modified overhand count of every round, e.g. from
+        draw_counts() or a Generator's integers(0, 5, size=...).
+        accumulate_hands (bool): See simulate_game.
+    Returns:
+        A SimulationResult.
+
+    >>> vectorized = simulate_vectorized(100, 10, 17, draw_counts(1000, 10), accumulate_hands=True)
+    >>> looped = simulate(1000, 100, 10, 17, accumulate_hands=True)
+    >>> vectorized.final_wallets.tolist() == looped.final_wallets.tolist()
+    True
+    >>> vectorized.rounds, vectorized.wins, vectorized.ties
+    (10000, 480, 9309)
+    >>> vectorized = simulate_vectorized(100, 10, 17, draw_counts(1000, 10))
+    >>> looped = simulate(1000, 100, 10, 17)
+    >>> vectorized.final_wallets.tolist() == looped.final_wallets.tolist()
+    True
+    """
+    assert isinstance(num_rounds, int)
+    assert isinstance(stand_threshold, int)
+    counts = asarray(counts)
+    num_games = len(counts)
+    values = array(CARD_VALUES)
+    positions = arange(NUM_CARDS)
+
+    decks = tile(positions.astype(int8), (num_games, 1))
+    sizes = full(num_games, NUM_CARDS)
+    wallets = full(num_games, wallet)
+    bets = full(num_games, 5)
+    # Only used with accumulate_hands, where hands keep their cards.
+    player_totals = zeros(num_games, dtype=intp)
+    player_aces = zeros(num_games, dtype=intp)
+    dealer_totals = zeros(num_games, dtype=intp)
+    dealer_aces = zeros(num_games, dtype=intp)
+    playing = ones(num_games, dtype=bool)
+    rounds = wins = losses = player_busts = dealer_busts = 0
+
+    min_cards = 4
+    for i in range(min(num_rounds, counts.shape[1] // 2)):
+        playing &= (sizes >= min_cards) & (wallets >= bets)
+        live = nonzero(playing)[0]
+        if len(live) == 0:
+            break
+        deck = Shuffle.shuffle_many(decks[live], counts[live, 2 * i + 1], counts[live, 2 * i], sizes[live])
+        size = sizes[live]
+        dealt = values[deck[:, :min_cards]]
+        player_total = dealt[:, 0] + dealt[:, 2]
+        player_ace = (dealt[:, 0] == ACE).astype(intp) + (dealt[:, 2] == ACE)
+        dealer_total = dealt[:, 1] + dealt[:, 3]
+        dealer_ace = (dealt[:, 1] == ACE).astype(intp) + (dealt[:, 3] == ACE)
+        if accumulate_hands:
+            player_total += player_totals[live]
+            player_ace += player_aces[live]
+            dealer_total += dealer_totals[live]
+            dealer_ace += dealer_aces[live]
+        top = full(len(live), min_cards)
+
+        # Same pull cap as hit_or_stand: no more pulls than cards left.
+        for total, aces, threshold in [(player_total, player_ace, stand_threshold),
+                                       (dealer_total, dealer_ace, 17)]:
+            start = top.copy()
+            hitting = nonzero((_scores(total, aces) < threshold) & (top - start < size - top))[0]
+            while len(hitting) > 0:
+                value = values[deck[hitting, top[hitting]]]
+                total[hitting] += value
+                aces[hitting] += value == ACE
+                top[hitting] += 1
+                rest = (_scores(total[hitting], aces[hitting]) < threshold) \
+                    & (top[hitting] - start[hitting] < size[hitting] - top[hitting])
+                hitting = hitting[rest]
+
+        decks[live] = take_along_axis(deck, minimum(positions + top[:, None], NUM_CARDS - 1), axis=1)
+        sizes[live] = size - top
+        player_totals[live] = player_total
+        player_aces[live] = player_ace
+        dealer_totals[live] = dealer_total
+        dealer_aces[live] = dealer_ace
+
+        player_score = _scores(player_total, player_ace)
+        dealer_score = _scores(dealer_total, dealer_ace)
+        player_bust = player_score > 21
+        dealer_bust = dealer_score > 21
+        winner = where(player_bust, where(dealer_bust, 0, -1),
+                       where(dealer_bust, 1, sign(player_score - dealer_score)))
+        bet = bets[live]
+        wallets[live] += winner * bet
+        bets[live] = maximum(bet + 5 * winner, 5)
+
+        rounds += len(live)
+        wins += int((winner == 1).sum())
+        losses += int((winner == -1).sum())
+        player_busts += int(player_bust.sum())
+        dealer_busts += int(dealer_bust.sum())
+
+        # Games whose hands are both bust for good only tie from here on,
+        # see simulate_game.
+        if not accumulate_hands:
+            continue
+        settled = player_bust & dealer_bust & (player_score >= stand_threshold)
+        remaining = where(wallets[live] >= bets[live],
+                          minimum(num_rounds - i - 1, sizes[live] // min_cards), 0)[settled]
+        rounds += int(remaining.sum())
+        player_busts += int(remaining.sum())
+        dealer_busts += int(remaining.sum())
+        playing[live[settled]] = False
+
+    return SimulationResult(wallets, rounds, wins, losses, rounds - wins - losses,
+                            player_busts, dealer_busts)
@@ -0,0 +1,217 @@
+from functools import lru_cache
+
+from card import ACE, CARD_VALUES, RANK_VALUES
+from hand import score
+from simulate import round_winner
+
+# Rules of play_round: the dealer stands once its score reaches 17 and
+# every total over 21 is a bust, kept as BUST in the outcomes.
+DEALER_STANDS = 17
+BUST = 22
+# Pass as the stand_threshold of play_round to play every player
+# decision by the solver instead of a fixed threshold. The solver is
+# approximate, see solve().
+SOLVER = 'solver'
+
+
+def rank_counts(codes):
+    """
+    Returns the composition of a list of card codes as a tuple of the
+    number of cards of each value, Aces (1) to tens (10).
+
+    >>> rank_counts([0, 1, 48, 40, 36])
+    (1, 2, 0, 0, 0, 0, 0, 0, 0, 2)
+    """
+    counts = [0] * 10
+    for code in codes:
+        counts[CARD_VALUES[code] - 1] += 1
+    return tuple(counts)
+
+
+def _without(counts, value):
+    counts = list(counts)
+    counts[value - 1] -= 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=4096)
+def dealer_outcomes(hard_total, num_aces, counts, hole=False):
+    """
+    Returns the distribution of the dealer's final score when it
+    draws from a deck with the composition `counts` until it reaches 17,
+    as a tuple of (score, probability) pairs. Every bust is BUST. With
+    `hole` the dealer has its hole card still to come and always draws it.
+
+    Results are kept in a bounded LRU cache keyed by the dealer's cards
+    and the remaining rank counts, so rounds with the same deck state
+    reuse them; the draws within one call share a memo of their own.
+
+    >>> dealer_outcomes(17, 0, rank_counts(range(52)))
+    ((17, 1.0),)
+    >>> sum([p for s, p in dealer_outcomes(10, 0, rank_counts(range(52)), hole=True)])
+    1.0
+    """
+    return _dealer(hard_total, num_aces, counts, hole, {})
+
+
+def _dealer(hard_total, num_aces, counts, hole, memo):
+    key = (hard_total, num_aces, counts)
+    if not hole and key in memo:
+        return memo[key]
+
+    dealer_score = score(hard_total, num_aces)
+    cards = sum(counts)
+    if cards == 0 or (not hole and dealer_score >= DEALER_STANDS):
+        return ((min(dealer_score, BUST), 1.0),)
+
+    outcomes = {}
+    for value in range(1, 11):
+        if counts[value - 1] == 0:
+            continue
+        p = counts[value - 1] / cards
+        for final, q in _dealer(hard_total + value, num_aces + (value == ACE),
+                                _without(counts, value), False, memo):
+            outcomes[final] = outcomes.get(final, 0) + p * q
+    outcomes = tuple(sorted(outcomes.items()))
+    if not hole:
+        memo[key] = outcomes
+    return outcomes
+
+
+def dealer_distribution(up_card, counts):
+    """
+    Returns the distribution of the dealer's final score for a
+    dealer showing `up_card` (its value, Aces as 1) with its hole card and
+    hits still to be drawn from `counts`, as a dictionary of score to
+    probability (see dealer_outcomes).
+
+    >>> full = rank_counts(range(52))
+    >>> outcomes = dealer_distribution(6, _without(full, 6))
+    >>> sorted(outcomes)
+    [17, 18, 19, 20, 21, 22]
+    >>> round(outcomes[BUST], 3)
+    0.421
+    """
+    assert 1 <= up_card <= 10 and len(counts) == 10
+    return dict(dealer_outcomes(up_card, up_card == ACE, counts, hole=True))
+
+
+def stand_value(player_score, dealer_hard, dealer_aces, counts):
+    """
+    Returns the expected result (1 win, 0 tie, -1 loss) of standing on
+    `player_score` against a dealer showing `dealer_hard` with its hole
+    card still unknown.
+    """
+    stand = _tables(dealer_hard, dealer_aces, counts)[0]
+    return stand[min(player_score, BUST)]
+
+
+@lru_cache(maxsize=1 << 12)
+def solve(player_hard, player_aces, dealer_hard, dealer_aces, counts):
+    """
+    Returns the approximate expected results of standing and of hitting
+    once and playing on by the same estimates, for a player hand (total
+    with Aces as 1 and number of Aces) against the dealer's visible
+    cards, drawing from `counts` (see rank_counts) which still holds the
+    dealer's hole card.
+    Hitting is None once the player is bust or only the hole card is
+    left.
+
+    The results follow determine_winner, so the closer total wins and
+    two busts tie. They are approximate: the player's draws come from the
+    composition left after each card, but the dealer's outcomes are
+    worked out once, for the composition at the decision, and not again
+    after every card the player draws. Working them out for every
+    composition makes basic_strategy() about fifty times slower, and the
+    plays only differ in close spots, such as hard 16 against a 3 and
+    hard 15 against a 6.
+
+    >>> full = rank_counts(range(52))
+    >>> stand, hit = solve(12, 0, 10, 0, _without(_without(_without(full, 10), 10), 2))
+    >>> round(stand, 3), round(hit, 3)
+    (-0.577, -0.29)
+    >>> stand, hit = solve(10, 1, 6, 0, _without(_without(_without(full, 9), 1), 6))
+    >>> stand > hit
+    True
+    """
+    stand, values = _tables(dealer_hard, dealer_aces, counts)
+    return _play(player_hard, player_aces, counts, stand, values)
+
+
+@lru_cache(maxsize=64)
+def _tables(dealer_hard, dealer_aces, counts):
+    # Every player hand solved against the same dealer cards and deck
+    # shares the value of standing on each score, and the values of the
+    # hands it hits to.
+    outcomes = dealer_outcomes(dealer_hard, dealer_aces, counts, hole=True)
+    stand = [sum([p * round_winner(player_score, final) for final, p in outcomes])
+             for player_score in range(BUST + 1)]
+    return stand, {}
+
+
+def _play(player_hard, player_aces, counts, stand_values, values):
+    key = (player_hard, player_aces, counts)
+    if key in values:
+        return values[key]
+
+    stand = stand_values[min(score(player_hard, player_aces), BUST)]
+    cards = sum(counts)
+    if player_hard > 21 or cards <= 1:
+        values[key] = (stand, None)
+        return values[key]
+
+    hit = 0
+    for value in range(1, 11):
+        if counts[value - 1] == 0:
+            continue
+        if player_hard + value > 21:
+            # Every bust stands on the same value.
+            hit += counts[value - 1] / cards * stand_values[BUST]
+            continue
+        next_values = _play(player_hard + value, player_aces + (value == ACE),
+                            _without(counts, value), stand_values, values)
+        hit += counts[value - 1] / cards * best(next_values)
+    values[key] = (stand, hit)
+    return values[key]
+
+
+def best(values):
+    """
+    Returns the expected result of the better play of solve().
+    """
+    stand, hit = values
+    return stand if hit is None else max(stand, hit)
+
+
+def should_hit(player_hard, player_aces, dealer_hard, dealer_aces, counts):
+    """
+    Returns whether the solver gives hitting a higher expected result
+    than standing.
+    """
+    stand, hit = solve(player_hard, player_aces, dealer_hard, dealer_aces, counts)
+    return hit is not None and hit > stand
+
+
+def basic_strategy(counts=None):
+    """
+    Returns the solver's play of every (player score, soft, dealer up-card
+    value) state as a dictionary of True to hit and False to stand,
+    for a deck of composition `counts` (a full deck by default) with the
+    dealer's up-card taken out.
+
+    >>> table = basic_strategy()
+    >>> table[(16, False, 10)], table[(16, False, 6)], table[(18, True, 10)]
+    (True, False, True)
+    """
+    if counts is None:
+        counts = rank_counts(range(len(CARD_VALUES)))
+    table = {}
+    for up in sorted(set(RANK_VALUES)):
+        if counts[up - 1] == 0:
+            continue
+        deck = _without(counts, up)
+        for player_score in range(4, 22):
+            table[(player_score, False, up)] = should_hit(player_score, 0, up, up == ACE, deck)
+            if 12 <= player_score:
+                table[(player_score, True, up)] = should_hit(player_score - 10, 1, up, up == ACE, deck)
+    return table
@@ -0,0 +1,133 @@
+from hand import score
+from solver import basic_strategy, should_hit
+
+# Strategies decide whether the player hits. Each is called with the
+# player's hand (its total with Aces counted as 1 and its number of
+# Aces), the dealer's visible cards the same way, and the composition of
+# the cards the player has not seen (see solver.rank_counts), and returns
+# True to hit and False to stand. Computing the composition takes a pass
+# over the deck, so play_round only does it for strategies whose
+# `uses_counts` is True and passes None otherwise.
+
+# Hi-Lo count of each card value, Aces (1) to tens (10).
+HI_LO = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1)
+
+
+class ThresholdStrategy:
+    """
+    Hits until the score reaches `stand_threshold`, the rule of
+    play_round with an integer threshold.
+
+    >>> strategy = ThresholdStrategy(17)
+    >>> strategy(16, 0, 10, 0, None), strategy(7, 1, 10, 0, None)
+    (True, False)
+    """
+
+    uses_counts = False
+
+    def __init__(self, stand_threshold):
+        assert isinstance(stand_threshold, int)
+
+        self.stand_threshold = stand_threshold
+
+    def __call__(self, player_hard, player_aces, dealer_hard, dealer_aces, counts):
+        return score(player_hard, player_aces) < self.stand_threshold
+
+
+class TableStrategy:
+    """
+    Looks the play up in a table of every (score, soft, dealer up-card)
+    state, the one of solver.basic_strategy() by default. The table is
+    flattened into a list indexed by the player's total, whether the hand
+    holds an Ace and the dealer's visible total, so a decision is a single
+    list lookup. Dealer totals over 10 use the column of 10.
+
+    >>> strategy = TableStrategy()
+    >>> strategy(16, 0, 10, 0, None), strategy(16, 0, 6, 0, None)
+    (True, False)
+    >>> strategy(7, 1, 10, 0, None), strategy(9, 1, 10, 0, None)
+    (True, False)
+    """
+
+    uses_counts = False
+
+    def __init__(self, table=None):
+        if table is None:
+            table = basic_strategy()
+
+        self.hits = []
+        for player_hard in range(22):
+            for has_ace in [False, True]:
+                player_score = score(player_hard, has_ace)
+                soft = player_score != player_hard
+                for up in range(11):
+                    self.hits.append(table.get((player_score, soft, up),
+                                               table.get((player_score, False, up), player_score < 17)))
+
+    def __call__(self, player_hard, player_aces, dealer_hard, dealer_aces, counts):
+        if player_hard > 21:
+            return False
+        return self.hits[(player_hard * 2 + (player_aces > 0)) * 11 + min(dealer_hard, 10)]
+
+
+class CountingStrategy:
+    """
+    Hi-Lo counting: moves `stand_threshold` down by one for every `step`
+    of the true count (the count of the cards already seen per deck left)
+    and up by one for every `step` below zero, within `min_threshold` and
+    `max_threshold`. A high count leaves more tens in the deck, so the
+    player stands sooner.
+
+    >>> from solver import rank_counts
+    >>> strategy = CountingStrategy(17)
+    >>> strategy.threshold(rank_counts(range(52)))
+    17
+    >>> strategy.threshold(rank_counts(range(20, 52)))
+    12
+    >>> strategy(13, 0, 10, 0, rank_counts(range(20, 52)))
+    False
+    """
+
+    uses_counts = True
+
+    def __init__(self, stand_threshold=17, step=2, min_threshold=12, max_threshold=21):
+        assert isinstance(stand_threshold, int) and step > 0
+        assert min_threshold <= stand_threshold <= max_threshold
+
+        self.stand_threshold = stand_threshold
+        self.step = step
+        self.min_threshold = min_threshold
+        self.max_threshold = max_threshold
+
+    def threshold(self, counts):
+        """
+        Returns the stand threshold for the cards left, `counts`.
+        """
+        cards = sum(counts)
+        if cards == 0:
+            return self.stand_threshold
+        # A full deck counts to zero, so the cards seen count to minus
+        # the cards left.
+        running = -sum([count * value for count, value in zip(counts, HI_LO)])
+        true_count = running / (cards / 52)
+        threshold = self.stand_threshold - int(true_count / self.step)
+        return min(max(threshold, self.min_threshold), self.max_threshold)
+
+    def __call__(self, player_hard, player_aces, dealer_hard, dealer_aces, counts):
+        return score(player_hard, player_aces) < self.threshold(counts)
+
+
+class SolverStrategy:
+    """
+    Hits whenever the solver gives hitting the higher expected result
+    (see solver.solve, whose results are approximate).
+
+    >>> from solver import rank_counts
+    >>> SolverStrategy()(12, 0, 10, 0, rank_counts(range(4, 52)))
+    True
+    """
+
+    uses_counts = True
+
+    def __call__(self, player_hard, player_aces, dealer_hard, dealer_aces, counts):
+        return should_hit(player_hard, player_aces, dealer_hard, dealer_aces, counts)
@@ -0,0 +1,272 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+
+
+class OpenFiles:
+    """
+    Keeps at most `limit` summary files open at once, however many games
+    are being played. Every flush of a SummaryWriter counts as a use of
+    its file; past the limit, the files used least recently are closed,
+    and their writers open them again to append when they next flush.
+
+    >>> from os.path import join
+    >>> from tempfile import TemporaryDirectory
+    >>> from card import Card
+    >>> from hand import PlayerHand, DealerHand
+    >>> hand = PlayerHand()
+    >>> hand.add_card(Card(9, "clubs"))
+    >>> dealer_hand = DealerHand()
+    >>> dealer_hand.add_card(Card(7, "hearts"))
+    >>> open_files = OpenFiles(limit=2)
+    >>> with TemporaryDirectory() as directory:
+    ...     writers = [SummaryWriter(join(directory, str(i)), open_files=open_files) for i in range(3)]
+    ...     for round in [1, 2]:
+    ...         for writer in writers:
+    ...             writer.write_round(hand, dealer_hand, 'Player', round)
+    ...             writer.flush()
+    ...     print([writer.file is not None for writer in writers])
+    ...     for writer in writers:
+    ...         writer.close()
+    ...     with open(join(directory, '0'), encoding='utf-8') as f:
+    ...         f.read().count('ROUND')
+    [False, True, True]
+    4
+    """
+
+    def __init__(self, limit=64):
+        assert isinstance(limit, int) and limit > 0
+
+        self.limit = limit
+        self.writers = OrderedDict()
+        self.lock = Lock()
+
+    def use(self, writer):
+        """
+        Marks the file of `writer` as the one used last. Returns the
+        writers over the limit, which the caller has to release().
+        """
+        with self.lock:
+            self.writers[writer] = None
+            self.writers.move_to_end(writer)
+            over = []
+            while len(self.writers) > self.limit:
+                over.append(self.writers.popitem(last=False)[0])
+            return over
+
+    def holds(self, writer):
+        with self.lock:
+            return writer in self.writers
+
+    def forget(self, writer):
+        with self.lock:
+            self.writers.pop(writer, None)
+
+
+class SummaryWriter:
+    """
+    Writes the round summaries of one game to its game summary file.
+
+    The file is created on the first flush and every round is appended
+    to it. Rounds are buffered and written `flush_every` at a time, on
+    flush() or when the writer is closed. The file stays open between
+    flushes, unless SummaryWriter.open_files has to close it to keep
+    under its limit. close() only releases the file: writing more rounds
+    afterwards opens it again, to append.
+
+    >>> from os.path import join
+    >>> from tempfile import TemporaryDirectory
+    >>> from card import Card
+    >>> from hand import PlayerHand, DealerHand
+    >>> player_hand = PlayerHand()
+    >>> player_hand.add_card(Card("A", "spades"))
+    >>> dealer_hand = DealerHand()
+    >>> dealer_hand.add_card(Card(7, "hearts"))
+    >>> with TemporaryDirectory() as directory:
+    ...     path = join(directory, "game_summary1.txt")
+    ...     with SummaryWriter(path, flush_every=2) as summary:
+    ...         summary.write_round(player_hand, dealer_hand, 'Player', 1)
+    ...         summary.pending_rounds()
+    ...         summary.write_round(player_hand, dealer_hand, 'Tied', 2)
+    ...         summary.pending_rounds()
+    ...     summary.write_round(player_hand, dealer_hand, 'Dealer', 3)
+    ...     summary.close()
+    ...     with open(path, encoding='utf-8') as f:
+    ...         print(f.read())
+    1
+    0
+    ROUND 1:
+    Player Hand:
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |7  |
+    | ♥ |
+    |__7|
+    Winner of ROUND 1: Player
+    <BLANKLINE>
+    ROUND 2:
+    Player Hand:
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |7  |
+    | ♥ |
+    |__7|
+    Winner of ROUND 2: Tied
+    <BLANKLINE>
+    ROUND 3:
+    Player Hand:
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |7  |
+    | ♥ |
+    |__7|
+    Winner of ROUND 3: Dealer
+    <BLANKLINE>
+    <BLANKLINE>
+    """
+
+    # Shared by all the writers that are not given their own.
+    open_files = OpenFiles()
+
+    def __init__(self, path, flush_every=16, open_files=None):
+        assert isinstance(flush_every, int) and flush_every > 0
+
+        self.path = path
+        self.flush_every = flush_every
+        self.open_files = SummaryWriter.open_files if open_files is None else open_files
+        self.pending = []
+        self.file = None
+        self.opened = False
+        # Another writer's flush can release this file from its thread.
+        self.lock = Lock()
+
+    def write_round(self, player_hand, dealer_hand, result, round):
+        """
+        Buffers the summary and outcome of a round, flushing once
+        `flush_every` rounds are pending.
+        """
+        self.pending.append('ROUND ' + str(round) + ':\nPlayer Hand:\n' + player_hand.__str__()
+                            + '\nDealer Hand:\n' + dealer_hand.__str__()
+                            + '\nWinner of ROUND ' + str(round) + ': ' + result + '\n\n')
+        if len(self.pending) >= self.flush_every:
+            self.flush()
+
+    def pending_rounds(self):
+        return len(self.pending)
+
+    def flush(self):
+        """
+        Writes the pending rounds to the file. The file is created (or
+        truncated) the first time and appended to afterwards.
+        """
+        if len(self.pending) == 0:
+            return
+        with self.lock:
+            if self.file is None:
+                # Remember to use encoding = "utf-8"
+                self.file = open(self.path, mode='a' if self.opened else 'w', encoding='utf-8')
+                self.opened = True
+            self.file.write(''.join(self.pending))
+            self.file.flush()
+            self.pending = []
+            over = self.open_files.use(self)
+        # Released with no lock held, as their own flush can be waiting
+        # on the open_files lock.
+        for writer in over:
+            writer.release()
+
+    def release(self):
+        """
+        Closes the file, unless it was flushed to again since open_files
+        let it go. Pending rounds are kept for the next flush.
+        """
+        with self.lock:
+            if self.file is not None and not self.open_files.holds(self):
+                self.file.close()
+                self.file = None
+
+    def close(self):
+        """
+        Flushes the pending rounds and closes the file.
+        """
+        self.flush()
+        with self.lock:
+            self.open_files.forget(self)
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SummaryPaths:
+    """
+    Hands out the paths of new game summary files, `template` numbered
+    from `first` on, each one created empty so no other game, thread or
+    process writes to it. The file numbers have nothing to do with the
+    game numbers.
+
+    The directory is looked at once, on the first claim, to carry on
+    after the highest number already there. After that a claim only
+    moves past a file that another process created in the meantime.
+
+    >>> from os.path import basename, join
+    >>> from tempfile import TemporaryDirectory
+    >>> with TemporaryDirectory() as directory:
+    ...     template = join(directory, 'game_summary{}.txt')
+    ...     open(template.format(5), 'w').close()
+    ...     paths = SummaryPaths(template)
+    ...     print(basename(paths.claim()), basename(paths.claim()))
+    game_summary6.txt game_summary7.txt
+    """
+
+    def __init__(self, template, first=2):
+        self.template = template
+        self.first = first
+        self.next = None
+        self.lock = Lock()
+
+    def _highest(self):
+        directory, name = os.path.split(self.template)
+        prefix, suffix = name.split('{}')
+        numbers = [self.first - 1]
+        if os.path.isdir(directory or '.'):
+            for f in os.listdir(directory or '.'):
+                number = f[len(prefix):len(f) - len(suffix)]
+                if f.startswith(prefix) and f.endswith(suffix) and number.isdigit():
+                    numbers.append(int(number))
+        return max(numbers)
+
+    def claim(self):
+        """
+        Creates the next summary file and returns its path. The file is
+        created with O_CREAT | O_EXCL, which the operating system carries
+        out atomically.
+        """
+        with self.lock:
+            if self.next is None:
+                self.next = self._highest() + 1
+            while True:
+                path = self.template.format(self.next)
+                self.next += 1
+                try:
+                    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    return path
+                except FileExistsError:
+                    pass
@@ -0,0 +1,158 @@
+from argparse import ArgumentParser
+from multiprocessing import Pool
+from numpy import empty, intp, sqrt
+from runner import game_rng
+from simulate import SimulationResult, num_draws, simulate_vectorized
+
+
+class SweepResult:
+    """
+    Results of a parameter sweep: a SimulationResult for every
+    (stand_threshold, wallet, num_rounds) cell of the grid, all played on
+    the same games.
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    def profits(self, cell):
+        """
+        Returns the final wallet minus the starting wallet of every game
+        of `cell`.
+        """
+        stand_threshold, wallet, num_rounds = cell
+        return self.cells[cell].final_wallets - wallet
+
+    def mean(self, cell):
+        return float(self.profits(cell).mean())
+
+    def variance(self, cell):
+        return float(self.profits(cell).var(ddof=1))
+
+    def confidence_interval(self, cell, z=1.96):
+        """
+        Returns the normal confidence interval of the mean profit of
+        `cell`, 95% by default.
+        """
+        mean = self.mean(cell)
+        half = z * float(sqrt(self.variance(cell) / self.cells[cell].num_games))
+        return mean - half, mean + half
+
+    def compare(self, cell, other, z=1.96):
+        """
+        Returns the mean difference in profit of `cell` over `other` and
+        its confidence interval. Both cells played the same games, so the
+        difference is taken game by game and is less noisy than the
+        difference of the two means on their own.
+        """
+        differences = self.profits(cell) - self.profits(other)
+        mean = float(differences.mean())
+        half = z * float(sqrt(differences.var(ddof=1) / len(differences)))
+        return mean, (mean - half, mean + half)
+
+    def best(self):
+        """
+        Returns the cell with the highest mean profit.
+        """
+        return max(self.cells, key=self.mean)
+
+    def report(self):
+        """
+        Returns a table of every cell's mean profit, variance and 95%
+        confidence interval.
+        """
+        lines = ['threshold wallet rounds       mean    variance      95% interval']
+        for cell in sorted(self.cells):
+            low, high = self.confidence_interval(cell)
+            lines.append(f'{cell[0]:9d} {cell[1]:6d} {cell[2]:6d} {self.mean(cell):10.3f} '
+                         f'{self.variance(cell):11.3f} [{low:8.3f}, {high:8.3f}]')
+        return '\n'.join(lines)
+
+
+def sweep_chunk(start, stop, thresholds, wallets, round_counts, seed):
+    """
+    Plays games `start` to `stop - 1` of a sweep seeded with `seed` in
+    every cell of the grid. The shuffle counts of each game are drawn
+    once, for the longest game, and shared by every cell.
+    """
+    most = num_draws(max(round_counts))
+    counts = empty((stop - start, most), dtype=intp)
+    for game in range(start, stop):
+        counts[game - start] = game_rng(seed, game).integers(0, 5, size=most)
+    return {(stand_threshold, wallet, num_rounds):
+            simulate_vectorized(wallet, num_rounds, stand_threshold, counts[:, :num_draws(num_rounds)])
+            for stand_threshold in thresholds for wallet in wallets for num_rounds in round_counts}
+
+
+def sweep(thresholds, wallets, round_counts, num_games, seed=0, workers=None, chunk_size=10000):
+    """
+    Simulates `num_games` games in every cell of the grid of stand
+    thresholds, starting wallets and round counts.
+
+    Every cell plays the same games (common random numbers): game i
+    deals from the shuffle counts of game_rng(seed, i) whatever the cell,
+    as run_games does, so differences between cells come from the
+    parameters rather than the luck of the deal. Chunks of games are
+    spread over a pool of `workers` processes.
+
+    Parameters:
+        thresholds, wallets, round_counts: Values of each parameter.
+        num_games (int): Number of games per cell.
+        seed (int): Root seed of the sweep.
+        workers (int): Number of processes, one per core by default;
+        1 runs the sweep in this process.
+        chunk_size (int): Number of games handed to a worker at a time.
+    Returns:
+        A SweepResult.
+
+    >>> result = sweep([15, 17], [100], [10], 2000, seed=1, workers=1, chunk_size=500)
+    >>> sorted(result.cells)
+    [(15, 100, 10), (17, 100, 10)]
+    >>> from runner import run_games
+    >>> result.cells[(17, 100, 10)].final_wallets.tolist() == run_games(2000, 100, 10, 17, seed=1, workers=1).final_wallets.tolist()
+    True
+    >>> low, high = result.confidence_interval((17, 100, 10))
+    >>> low < result.mean((17, 100, 10)) < high
+    True
+    >>> difference, (low, high) = result.compare((15, 100, 10), (17, 100, 10))
+    >>> low_15, high_15 = result.confidence_interval((15, 100, 10))
+    >>> low_17, high_17 = result.confidence_interval((17, 100, 10))
+    >>> high - low < ((high_15 - low_15) ** 2 + (high_17 - low_17) ** 2) ** 0.5 # Narrower than unpaired
+    True
+    """
+    assert isinstance(num_games, int) and num_games > 1
+    assert isinstance(chunk_size, int) and chunk_size > 0
+
+    chunks = [(start, min(start + chunk_size, num_games), thresholds, wallets, round_counts, seed)
+              for start in range(0, num_games, chunk_size)]
+    if workers == 1:
+        results = [sweep_chunk(*chunk) for chunk in chunks]
+    else:
+        with Pool(workers) as pool:
+            results = pool.starmap(sweep_chunk, chunks)
+    return SweepResult({cell: SimulationResult.merge([result[cell] for result in results])
+                        for cell in results[0]})
+
+
+def _values(text):
+    # '12-21' is a range of values, '100,500' a list of them.
+    if '-' in text:
+        low, high = text.split('-')
+        return list(range(int(low), int(high) + 1))
+    return [int(value) for value in text.split(',')]
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Sweep stand thresholds, wallets and round counts.')
+    parser.add_argument('--thresholds', default='12-21', help="e.g. '12-21' or '15,17'")
+    parser.add_argument('--wallets', default='100')
+    parser.add_argument('--rounds', default='10')
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    result = sweep(_values(args.thresholds), _values(args.wallets), _values(args.rounds),
+                   args.games, args.seed, args.workers)
+    print(result.report())
+    print('best:', result.best())
@@ -0,0 +1,80 @@
+import json
+from time import perf_counter
+
+# Phases of a round timed by play_round, in order, starting with the
+# reshuffle of a shoe before the rounds that have one, then the writing
+# of the summary file once at the end of every play_round call.
+PHASES = ['reshuffle', 'shuffle', 'deal', 'player', 'dealer', 'determine_winner', 'add_to_file',
+          'export', 'write_summary']
+
+
+class PhaseTimer:
+    """
+    Wall time and call counts of the phases of play_round. Pass one as the
+    `timer` of a Blackjack game; without one play_round only checks for
+    it once per phase.
+
+    With `trace` every timed phase is also kept as an event, so the run
+    can be opened in chrome://tracing or Perfetto (see chrome_trace).
+
+    >>> timer = PhaseTimer(trace=True)
+    >>> start = perf_counter()
+    >>> start = timer.record('shuffle', start)
+    >>> start = timer.record('deal', start)
+    >>> timer.calls['shuffle'], timer.calls['deal'], timer.calls['player']
+    (1, 1, 0)
+    >>> len(timer.events)
+    2
+    >>> print(timer.report().splitlines()[0])
+    phase                 calls    total ms  mean us  share
+    """
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.totals = {phase: 0.0 for phase in PHASES}
+        self.calls = {phase: 0 for phase in PHASES}
+        self.events = []
+        self.origin = perf_counter()
+
+    def record(self, phase, start):
+        """
+        Adds the time since `start` to `phase`.
+
+        Returns:
+            The current time, the start of the next phase.
+        """
+        now = perf_counter()
+        self.totals[phase] = self.totals.get(phase, 0.0) + now - start
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        if self.trace:
+            self.events.append((phase, start, now - start))
+        return now
+
+    def reset(self):
+        self.__init__(self.trace)
+
+    def report(self):
+        """
+        Returns a table of the calls, total and mean time and share of
+        the total time of every phase.
+        """
+        total = sum(self.totals.values())
+        lines = ['phase                 calls    total ms  mean us  share']
+        for phase in self.totals:
+            calls = self.calls[phase]
+            seconds = self.totals[phase]
+            mean = seconds / calls * 1e6 if calls else 0.0
+            share = seconds / total if total else 0.0
+            lines.append(f'{phase:20s} {calls:6d} {seconds * 1e3:11.3f} {mean:8.2f} {share:6.1%}')
+        return '\n'.join(lines)
+
+    def chrome_trace(self, path):
+        """
+        Writes the traced events in the Chrome trace event format.
+        """
+        assert self.trace, 'Create the PhaseTimer with trace=True'
+        events = [{'name': phase, 'cat': 'play_round', 'ph': 'X', 'pid': 0, 'tid': 0,
+                   'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6}
+                  for phase, start, duration in self.events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)